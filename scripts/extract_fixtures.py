@@ -7,6 +7,9 @@ import os
 import re
 import sys
 import hashlib
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 
 # Anonymization mappings - consistent replacements
 NAMES = {
@@ -44,98 +47,257 @@ COMPANIES = {
     "Xsolla": "GamePay",
 }
 
+# Compound names replaced anywhere, even inside longer words (case-sensitive)
+COMPOUND_NAMES = {
+    "rogeralsing": "andersb",
+    "Rogeralsing": "Andersb",
+    "rogerjohansson": "andersanderson",
+}
 
-def anonymize_text(text: str) -> str:
-    """Replace personal data with fake data."""
-    result = text
+# Number of payload files each worker extracts and anonymizes together
+BATCH_SIZE = 32
 
-    # Replace compound names first (before splitting on word boundaries)
-    result = result.replace("rogeralsing", "andersb")
-    result = result.replace("Rogeralsing", "Andersb")
-    result = result.replace("rogerjohansson", "andersanderson")
 
-    # Replace names
-    for real, fake in NAMES.items():
-        result = re.sub(rf"\b{real}\b", fake, result, flags=re.IGNORECASE)
+# Compound names, names and companies share one alternation so the text is
+# scanned once; compounds come first and are matched without word boundaries.
+_REPLACEMENTS = {real.lower(): fake for real, fake in {**NAMES, **COMPANIES}.items()}
+_LITERAL_KEYS_LOWER = tuple(sorted(_REPLACEMENTS, key=len, reverse=True))
 
-    # Replace companies
-    for real, fake in COMPANIES.items():
-        result = re.sub(rf"\b{real}\b", fake, result, flags=re.IGNORECASE)
 
-    # Replace Swedish org numbers (10 digits, often with dash: 556666-1012)
-    result = re.sub(
-        r"\b(\d{6})-?(\d{4})\b", lambda m: f"{anonymize_number(m.group(0), 10)}", result
+@lru_cache(maxsize=None)
+def _replacement_pattern(keys: frozenset[str]) -> re.Pattern:
+    """Build the alternation for the names and companies present in a text."""
+    return re.compile(
+        "("
+        + "|".join(re.escape(real) for real in COMPOUND_NAMES)
+        + r")|(?i:\b("
+        + "|".join(re.escape(real) for real in _LITERAL_KEYS_LOWER if real in keys)
+        + r")\b)"
     )
 
-    # Replace customer IDs (various formats)
-    result = re.sub(
-        r"\b\d{7,10}\b", lambda m: anonymize_number(m.group(0), len(m.group(0))), result
-    )
 
-    # Replace phone numbers
-    result = re.sub(r"\+46\s*\d[\d\s]{8,12}", "+46 8 123 456 78", result)
-    result = re.sub(r"\b08-\d{3}\s*\d{2}\s*\d{2}\b", "08-123 45 67", result)
+# Numeric and format scrubbers, tried in this order at each position of a
+# single scan. Emails and URLs come first so numbers inside them are replaced
+# together with the rest of the address.
+_SCRUBBERS = {
+    # Email addresses (keep domain structure)
+    "email": (r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", "info@example.com"),
+    # URLs with example.com (but keep structure)
+    "url": (r"https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}[^\s]*", "https://example.com/page"),
+    # Swedish org numbers (10 digits, often with dash: 556666-1012)
+    "org": (r"\b\d{6}-?\d{4}\b", lambda value: anonymize_number(value, 10)),
+    # Customer IDs and order/invoice numbers (preserve format)
+    "custid": (r"\b\d{7,10}\b", lambda value: anonymize_number(value, len(value))),
+    # Phone numbers
+    "phone46": (r"\+46\s*\d[\d\s]{8,12}", "+46 8 123 456 78"),
+    "phone08": (r"\b08-\d{3}\s*\d{2}\s*\d{2}\b", "08-123 45 67"),
+    # Swedish postal codes
+    "postal": (r"\b\d{3}\s*\d{2}\b", "123 45"),
+    # IBANs
+    "iban": (r"\bSE\d{22}\b", "SE1234567890123456789012"),
+    # VAT numbers
+    "vat": (r"\bSE\d{10}01\b", "SE123456789001"),
+    # License IDs
+    "license": (r"\b[A-Z0-9]{10}\b", "ABCD123456"),
+}
+_SCRUB_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, (pattern, _) in _SCRUBBERS.items())
+)
+_PAGE_MARKER_PATTERN = re.compile(r"---\s*Page\s*\d+\s*---\s*\n?")
 
-    # Replace Swedish addresses
-    result = re.sub(r"\b\d{3}\s*\d{2}\b", "123 45", result)  # Postal codes
 
-    # Replace email addresses (keep domain structure)
-    result = re.sub(
-        r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", "info@example.com", result
-    )
+def anonymize_text(text: str) -> str:
+    """Replace personal data with fake data."""
+    result = text
 
-    # Replace IBANs
-    result = re.sub(r"\bSE\d{22}\b", "SE1234567890123456789012", result)
+    # Replace compound names, names and companies in a single scan, limited
+    # to the keys that occur at all (every compound name contains one)
+    lowered = result.lower()
+    keys_present = frozenset(real for real in _LITERAL_KEYS_LOWER if real in lowered)
+    if keys_present:
+        result = _replacement_pattern(keys_present).sub(_replace_name, result)
 
-    # Replace VAT numbers
-    result = re.sub(r"\bSE\d{10}01\b", "SE123456789001", result)
+    # Replace numbers, phones, addresses, emails and URLs in a single scan
+    result = _SCRUB_PATTERN.sub(_scrub, result)
 
-    # Replace order/invoice numbers (preserve format)
-    result = re.sub(r"\b\d{9}\b", lambda m: anonymize_number(m.group(0), 9), result)
+    return result
 
-    # Replace URLs with example.com (but keep structure)
-    result = re.sub(
-        r"https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}[^\s]*",
-        "https://example.com/page",
-        result,
-    )
 
-    # Replace license IDs
-    result = re.sub(r"\b[A-Z0-9]{10}\b", "ABCD123456", result)
+def _scrub(match: re.Match) -> str:
+    """Dispatch a scrubber match to the replacement of the group that matched."""
+    name = match.lastgroup
+    replacement = _SCRUBBERS[name][1]
+    if isinstance(replacement, str):
+        return replacement
+    return replacement(match.group(name))
 
-    return result
+
+def _replace_name(match: re.Match) -> str:
+    """Look up the fake value for a compound name, name or company match."""
+    compound = match.group(1)
+    if compound:
+        return COMPOUND_NAMES[compound]
+    real = match.group(2)
+    return _preserve_case(real, _REPLACEMENTS[real.lower()])
 
 
+def _preserve_case(original: str, fake: str) -> str:
+    """Match the casing of an all-upper or all-lower original."""
+    if original.isupper():
+        return fake.upper()
+    if original.islower():
+        return fake.lower()
+    return fake
+
+
+# The same numbers recur across a corpus, so keep their fakes around
+@lru_cache(maxsize=8192)
 def anonymize_number(num_str: str, length: int) -> str:
     """Generate a consistent fake number based on input."""
-    # Use hash for consistency
-    h = hashlib.md5(num_str.encode()).hexdigest()
-    # Convert hex to digits
-    digits = "".join(str(int(c, 16) % 10) for c in h)
+    # Use hash for consistency (not security, so a fast 64-bit BLAKE2b will do)
+    h = hashlib.blake2b(num_str.encode(), digest_size=8).digest()
+    # Convert the whole digest to decimal digits in one step
+    digits = str(int.from_bytes(h, "big"))
     return digits[:length].zfill(length)
 
 
+_START_MARKER = "Poppler pdftotext**********"
+_END_MARKER = "Python MarkItDown**********"
+
+
 def extract_poppler_section(content: str) -> str | None:
     """Extract text between Poppler pdftotext and Python MarkItDown markers."""
-    start_marker = "Poppler pdftotext**********"
-    end_marker = "Python MarkItDown**********"
-
-    start_idx = content.find(start_marker)
+    start_idx = content.find(_START_MARKER)
     if start_idx == -1:
         return None
 
-    start_idx += len(start_marker)
+    start_idx += len(_START_MARKER)
 
-    end_idx = content.find(end_marker, start_idx)
+    end_idx = content.find(_END_MARKER, start_idx)
     if end_idx == -1:
         return None
 
-    section = content[start_idx:end_idx].strip()
+    return _strip_section(content[start_idx:end_idx])
+
+
+def _strip_section(section: str) -> str:
+    """Trim a raw section and remove its "--- Page X ---" markers."""
+    return _PAGE_MARKER_PATTERN.sub("", section.strip())
 
-    # Remove "--- Page X ---" markers
-    section = re.sub(r"---\s*Page\s*\d+\s*---\s*\n?", "", section)
 
-    return section
+def read_poppler_section(filepath: str) -> str | None:
+    """Read a payload file and return only its Poppler section.
+
+    The file is memory-mapped and only the bytes between the markers are
+    decoded, so the rest of the payload is never turned into a string.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start_idx = mm.find(_START_MARKER.encode())
+                if start_idx == -1:
+                    return None
+
+                start_idx += len(_START_MARKER)
+
+                end_idx = mm.find(_END_MARKER.encode(), start_idx)
+                if end_idx == -1:
+                    return None
+
+                section = mm[start_idx:end_idx].decode("utf-8")
+    except Exception as e:
+        print(f"Error reading {filepath}: {e}")
+        return None
+
+    # Reading bytes skips the newline translation text mode would have done
+    section = section.replace("\r\n", "\n").replace("\r", "\n")
+    return _strip_section(section)
+
+
+# Joins sections for a batched scrub. NUL is not matched by any pattern
+# except the URL tail, and the newline stops that, so nothing can span it.
+_BATCH_SEPARATOR = "\0\n\0"
+
+
+def anonymize_sections(sections: list[str]) -> list[str]:
+    """Anonymize several sections with one scan per pattern."""
+    if len(sections) < 2 or any("\0" in section for section in sections):
+        return [anonymize_text(section) for section in sections]
+
+    parts = anonymize_text(_BATCH_SEPARATOR.join(sections)).split("\n\0")
+    if len(parts) != len(sections):
+        return [anonymize_text(section) for section in sections]
+
+    # A URL at the end of a section swallows the separator's first NUL
+    return [part.rstrip("\0") for part in parts]
+
+
+def output_path(filepath: str, source_dir: str, output_dir: str) -> str:
+    """Build the flattened output path for a payload file."""
+    # source_dir is normalized by main; joining "" adds the trailing separator
+    # unless it already ends in one, as a root like "/" does
+    prefix_length = len(os.path.join(source_dir, ""))
+    rel_path, filename = os.path.split(filepath[prefix_length:])
+    rel_path = rel_path or "."
+    safe_name = rel_path.replace(os.sep, "_").replace("/", "_")
+    out_filename = f"{safe_name}_{filename}"
+    return os.path.join(output_dir, out_filename)
+
+
+def write_output(out_path: str, text: str) -> None:
+    """Write a fixture with raw os calls, skipping the file object layers."""
+    data = text.encode("utf-8")
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # os.write may write less than asked for, so loop until done
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def process_files(filepaths: list[str], source_dir: str, output_dir: str) -> list[str]:
+    """Extract and anonymize a batch of payload files. Returns the output paths."""
+    sections = []
+    out_paths = []
+    for filepath in filepaths:
+        section = read_poppler_section(filepath)
+        if not section:
+            continue
+
+        # Skip very short sections
+        if len(section) < 100:
+            continue
+
+        sections.append(section)
+        out_paths.append(output_path(filepath, source_dir, output_dir))
+
+    # Anonymize the whole batch at once
+    for out_path, anonymized in zip(out_paths, anonymize_sections(sections)):
+        write_output(out_path, anonymized)
+
+    return out_paths
+
+
+def iter_payload_files(source_dir: str):
+    """Yield payload .txt files below source_dir, skipping masked files."""
+    stack = [source_dir]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, list symlinked dirs but don't descend
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif entry.name.endswith(".txt") and "_masked" not in entry.name:
+                    yield entry.path
 
 
 def main():
@@ -143,51 +305,22 @@ def main():
         print("Usage: python extract_fixtures.py <source_dir> <output_dir>")
         sys.exit(1)
 
-    source_dir = sys.argv[1]
+    source_dir = os.path.normpath(sys.argv[1])
     output_dir = sys.argv[2]
 
     os.makedirs(output_dir, exist_ok=True)
 
+    filepaths = list(iter_payload_files(source_dir))
+
+    # Files are independent, so spread batches of them over all cores
     count = 0
-    for root, dirs, files in os.walk(source_dir):
-        # Skip masked files
-        for filename in files:
-            if not filename.endswith(".txt"):
-                continue
-            if "_masked" in filename:
-                continue
-
-            filepath = os.path.join(root, filename)
-
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception as e:
-                print(f"Error reading {filepath}: {e}")
-                continue
-
-            section = extract_poppler_section(content)
-            if not section:
-                continue
-
-            # Skip very short sections
-            if len(section) < 100:
-                continue
-
-            # Anonymize
-            anonymized = anonymize_text(section)
-
-            # Generate output filename from path
-            rel_path = os.path.relpath(root, source_dir)
-            safe_name = rel_path.replace(os.sep, "_").replace("/", "_")
-            out_filename = f"{safe_name}_{filename}"
-            out_path = os.path.join(output_dir, out_filename)
-
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(anonymized)
-
-            print(f"Extracted: {out_path}")
-            count += 1
+    batches = [filepaths[i : i + BATCH_SIZE] for i in range(0, len(filepaths), BATCH_SIZE)]
+    worker = partial(process_files, source_dir=source_dir, output_dir=output_dir)
+    with ProcessPoolExecutor() as executor:
+        for out_paths in executor.map(worker, batches):
+            for out_path in out_paths:
+                print(f"Extracted: {out_path}")
+                count += 1
 
     print(f"\nExtracted {count} fixtures")
 
@@ -3,6 +3,7 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Map: original prefix -> anonymized prefix
 # These are applied to the first part of filename (before first _)
@@ -51,50 +52,62 @@ SUBPART_MAP = {
 }
 
 
-def rename_file(filepath: str) -> str:
-    """Rename a file, replacing company names."""
-    dirname = os.path.dirname(filepath)
-    filename = os.path.basename(filepath)
+def renamed_path(filepath: str) -> str:
+    """Return the anonymized path for a file, replacing company names."""
+    dirname, filename = os.path.split(filepath)
 
-    parts = filename.split("_")
-    if len(parts) < 2:
+    # Locate the first two parts without splitting the whole name
+    i = filename.find("_")
+    if i == -1:
         return filepath
+    j = filename.find("_", i + 1)
+    part0 = filename[:i]
+    part1 = filename[i + 1 :] if j == -1 else filename[i + 1 : j]
 
-    # Replace first part (company)
-    if parts[0] in COMPANY_MAP:
-        parts[0] = COMPANY_MAP[parts[0]]
-
-    # Replace second part (subpart like user/department)
-    if parts[1] in SUBPART_MAP:
-        parts[1] = SUBPART_MAP[parts[1]]
+    # Replace first part (company) and second part (subpart like user/department)
+    new0 = COMPANY_MAP.get(part0, part0)
+    new1 = SUBPART_MAP.get(part1, part1)
 
     # Handle stripe's long account names
-    if "invoicestatementsacct" in parts[1]:
-        parts[1] = "statements"
+    if "invoicestatementsacct" in new1:
+        new1 = "statements"
+
+    if new0 == part0 and new1 == part1:
+        return filepath
+
+    new_filename = f"{new0}_{new1}" if j == -1 else f"{new0}_{new1}_{filename[j + 1 :]}"
+    return os.path.join(dirname, new_filename)
 
-    new_filename = "_".join(parts)
 
-    if new_filename != filename:
-        new_path = os.path.join(dirname, new_filename)
+def rename_file(filepath: str) -> str:
+    """Rename a file, replacing company names."""
+    new_path = renamed_path(filepath)
+    if new_path != filepath:
         os.rename(filepath, new_path)
-        return new_path
-    return filepath
+    return new_path
 
 
 def main():
     fixtures_dir = sys.argv[1] if len(sys.argv) > 1 else "fixtures"
 
-    count = 0
-    for filename in os.listdir(fixtures_dir):
-        if not filename.endswith(".txt"):
-            continue
-        filepath = os.path.join(fixtures_dir, filename)
-        new_path = rename_file(filepath)
-        if new_path != filepath:
-            print(f"{filename} -> {os.path.basename(new_path)}")
-            count += 1
-
-    print(f"\nRenamed {count} files")
+    # Plan all renames up front, skipping files that keep their name
+    plan = []
+    with os.scandir(fixtures_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".txt"):
+                continue
+            new_path = renamed_path(entry.path)
+            if new_path != entry.path:
+                plan.append((entry.path, new_path))
+
+    # os.rename releases the GIL, so threads overlap the syscalls
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda paths: os.rename(*paths), plan))
+
+    for old_path, new_path in plan:
+        print(f"{os.path.basename(old_path)} -> {os.path.basename(new_path)}")
+
+    print(f"\nRenamed {len(plan)} files")
 
 
 if __name__ == "__main__":
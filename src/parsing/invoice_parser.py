@@ -4,7 +4,8 @@
 import json
 import re
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Final, Optional
 from decimal import Decimal
 
 # Optional imports with fallbacks
@@ -21,6 +22,170 @@ except ImportError:
     HAS_PRICE_PARSER = False
 
 
+# Field patterns, compiled once and tried in order
+_INVOICE_NUMBER_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"Invoice\s*number[:\s]+([A-Z0-9\-]+)",
+        r"Fakturanummer[:\s]+([A-Z0-9\-]+)",
+        r"Fakturanr[:\s]+([A-Z0-9\-]+)",
+        r"Invoice\s*#[:\s]*([A-Z0-9\-]+)",
+        r"Invoice[:\s]+([A-Z0-9\-]{4,})",  # At least 4 chars
+    )
+)
+
+_INVOICE_DATE_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"Invoice\s*date\s+(\d{4}-\d{2}-\d{2})",  # YYYY-MM-DD
+        r"Invoice\s*date\s+(\d{2}\.\d{2}\.\d{4})",  # DD.MM.YYYY
+        r"Fakturadatum\s+(\d{4}-\d{2}-\d{2})",
+        r"Date\s+of\s+issue\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # Month DD, YYYY with space
+        r"Date\s+of\s+issue([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # Month DD, YYYY no space
+        r"Invoice\s*date\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",
+        r"Order\s+Date[:\s]+(\d{2}/\d{2}/\d{4})",  # US MM/DD/YYYY
+        r"Transaction\s+Date[:\s]+(\d{2}/\d{2}/\d{4})",
+        r"Date[:\s]+(\d{2}/\d{2}/\d{4})",  # Generic US date
+        r"Date[:\s]+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # Date: Jan 06, 2022
+        r"Datum[:\s]+(\d{4}-\d{2}-\d{2})",  # Swedish Datum: YYYY-MM-DD
+    )
+)
+
+_DUE_DATE_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"Due\s*date\s+(\d{4}-\d{2}-\d{2})",
+        r"Due\s*date\s+(\d{2}\.\d{2}\.\d{4})",
+        r"Date\s+due\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # with space
+        r"Date\s+due([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # no space
+        r"Förfallodatum\s+(\d{4}-\d{2}-\d{2})",
+        r"Förfallodag\s+(\d{4}-\d{2}-\d{2})",
+        r"Betala\s+senast\s+(\d{4}-\d{2}-\d{2})",
+    )
+)
+
+_TOTAL_AMOUNT_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        # "Total amount 20,907.00 SEK" or "Total amount                               20,907.00 SEK"
+        r"Total\s+amount\s+([0-9,.\s]+)\s*(SEK|EUR|USD|NOK|DKK|GBP)",
+        # "To pay SEK 171,000.00" or "To pay        SEK 171,000.00"
+        r"To\s+pay\s+(SEK|EUR|USD|NOK|DKK|GBP)\s*([0-9,.\s]+)",
+        # "Amount due €14.68"
+        r"Amount\s+due[:\s]*([€$]?)([0-9,.\s]+)",
+        # "Att betala 150 kr" or "Att betala: 150 kr"
+        r"Att\s+betala[:\s]+([0-9,.\s]+)\s*(SEK|kr)?",
+        # "Total price: $150.00 USD" - with $ prefix and currency suffix
+        r"Total\s+price[:\s]+\$([0-9,.\s]+)\s*(USD)?",
+        # "Total price: €14.68" or "Total price:                 $150.00"
+        r"Total\s+price[:\s]+([€$]?)([0-9,.\s]+)",
+        # "Total €14.68" at end of line
+        r"Total\s*([€$]?)([0-9,.\s]+)\s*$",
+        # "€14.68 due"
+        r"([€$])([0-9,.\s]+)\s+due",
+        # "$150.00 USD" standalone pattern
+        r"\$([0-9,.\s]+)\s*(USD)",
+        # "Total: 1537,50" with optional trailing whitespace
+        r"Total:\s+([0-9][0-9,.\s]*[0-9])",
+        # Fallback: "Total" followed by currency and amount
+        r"Total[:\s]+(SEK|EUR|USD|NOK)\s*([0-9,.\s]+)",
+        # "Summa: 1234,56" Swedish total
+        r"Summa[:\s]+([0-9,.\s]+)",
+        # "Belopp: 1234,56" Swedish amount
+        r"Belopp[:\s]+([0-9,.\s]+)\s*(SEK|kr)?",
+    )
+)
+
+_VAT_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        # "VAT (0 %)                                                     0.00"
+        r"VAT\s*\([^)]+\)\s+([0-9,.\s]+)",
+        # "VAT - Sweden (25% on €11.74)                         €2.94"
+        r"VAT\s*-\s*\w+\s*\([^)]+\)\s*([€$]?)([0-9,.\s]+)",
+        # "Moms: 25.00" or "Moms 25.00"
+        r"Moms[:\s]+([0-9,.\s]+)",
+        # "MVA (25%): 500"
+        r"MVA\s*\([^)]+\)[:\s]*([0-9,.\s]+)",
+    )
+)
+
+_VENDOR_PATTERNS = tuple(
+    re.compile(p, re.MULTILINE)
+    for p in (
+        # "Invoice    Helleborg AS" pattern
+        r"Invoice\s{2,}([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s]{1,30}(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\s*$",
+        # "From\nAsynkron AB" pattern
+        r"From\n+([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s]{1,30}(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\s*$",
+        # "Anthropic, PBC" at start of line
+        r"^([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ,\s]{1,30}(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\s*$",
+        # Standalone company name line
+        r"\n([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s]{2,25}\s(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\n",
+    )
+)
+
+_CUSTOMER_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"Bill\s+to[:\s]+([A-Za-zÀ-ÿ\s]+(?:AB|AS|Inc|Organization)?)",
+        r"Invoice\s+address\s+([A-Za-zÀ-ÿ\s]+(?:AB|AS|as))",
+        r"Kund[:\s]+([A-Za-zÀ-ÿ\s]+(?:AB|AS))",
+    )
+)
+
+_ORG_NUMBER_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"(?:Org\.?\s*(?:nr|no|nummer)?|Corporate\s+identity\s+no\.?)[:\s]+([A-Z]{0,2}\s*[\d\s\-]+)",
+        r"VAT\s+(?:identification\s+)?number[:\s]+([A-Z]{2}\d+)",
+        r"(\d{6}-\d{4})",  # Swedish format
+        r"(NO\s*\d{3}\s*\d{3}\s*\d{3}\s*MVA)",  # Norwegian format
+    )
+)
+
+# Payload sections start with "Header****" and end at the next such line
+_SECTION_END_PATTERN = re.compile(r"\n\w+\*+")
+
+
+@lru_cache(maxsize=None)
+def _section_headers_pattern(headers: tuple[str, ...]) -> re.Pattern:
+    """Compile the pattern locating any of the headers; group "h<i>" is the i-th."""
+    alternatives = "|".join(f"(?P<h{i}>{re.escape(header)})" for i, header in enumerate(headers))
+    return re.compile(rf"(?:{alternatives})\*+\s*", re.IGNORECASE)
+
+
+_AMOUNT_CHARS_PATTERN = re.compile(r'^[0-9,.\s]+$')
+
+# Month name to number mapping (Swedish names the same as English are not repeated)
+_MONTHS: Final[dict[str, int]] = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    # Swedish
+    "januari": 1, "februari": 2, "mars": 3,
+    "maj": 5, "juni": 6, "juli": 7, "augusti": 8,
+    "oktober": 10,
+}
+
+# Date formats handled by _normalize_date
+_MONTH_DAY_YEAR_PATTERN = re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})$')
+_DAY_MONTH_YEAR_PATTERN = re.compile(r'^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$')
+
+# Weight of each locale signal category
+_CATEGORY_WEIGHTS = {
+    "currency": 2,      # Medium signal (can be different from locale)
+    "company": 4,       # Strong signal - company suffix is very telling
+    "labels": 2,        # Good signal
+    "org_number": 5,    # Very strong signal - definitive
+    "address": 3,       # Good signal for US (state + zip)
+    "city": 4,          # Strong signal - major US cities
+    "date": 1,          # Weak (formats overlap)
+    "amount": 1,        # Weak (formats overlap)
+}
+
+
 class InvoiceParser:
     """
     Generic invoice parser targeting Swedish/Nordic/European invoice formats.
@@ -30,6 +195,8 @@ class InvoiceParser:
     - US/International invoices (Month DD, YYYY dates, USD/EUR)
     """
 
+    __slots__ = ("text", "poppler", "pdfplumber", "best", "detected_locale", "locale_scores")
+
     # Currency patterns - ISO codes take priority
     CURRENCY_MAP = {
         "sek": "SEK", "kr": "SEK", "kronor": "SEK",
@@ -90,8 +257,9 @@ class InvoiceParser:
             "currency": [r"\$\s*[\d,]+\.\d{2}", r"\bUSD\b", r"\bdollars?\b"],
             "company": [r"\b(?:Inc|LLC|Corp|Corporation|PBC)\b\.?"],  # PBC = Public Benefit Corp
             "labels": [r"\bSales\s+tax\b", r"\bState\s+tax\b", r"\bBill\s+to\b", r"\bAmount\s+due\b"],
-            "address": [r"\b(?:CA|NY|TX|FL|WA|MA|IL|PA|OH|GA|NC|NJ|VA|AZ|CO|TN|MI|MO|MD|WI|MN|SC|AL|LA|KY|OR|OK|CT|UT|IA|NV|AR|MS|KS|NM|NE|WV|ID|HI|NH|ME|MT|RI|DE|SD|ND|AK|VT|WY|DC)\s+\d{5}(?:-\d{4})?\b"],  # All US state codes
-            "city": [r"\b(?:San\s+Francisco|New\s+York|Los\s+Angeles|Chicago|Houston|Phoenix|Philadelphia|San\s+Antonio|San\s+Diego|Dallas|Austin|Seattle|Denver|Boston|Washington|Atlanta)\b"],
+            # Lookahead guards let most positions fail before trying every alternative
+            "address": [r"\b(?=[A-Z]{2}\s)(?:CA|NY|TX|FL|WA|MA|IL|PA|OH|GA|NC|NJ|VA|AZ|CO|TN|MI|MO|MD|WI|MN|SC|AL|LA|KY|OR|OK|CT|UT|IA|NV|AR|MS|KS|NM|NE|WV|ID|HI|NH|ME|MT|RI|DE|SD|ND|AK|VT|WY|DC)\s+\d{5}(?:-\d{4})?\b"],  # All US state codes
+            "city": [r"\b(?=[ABCDHLNPSW])(?:San\s+Francisco|New\s+York|Los\s+Angeles|Chicago|Houston|Phoenix|Philadelphia|San\s+Antonio|San\s+Diego|Dallas|Austin|Seattle|Denver|Boston|Washington|Atlanta)\b"],
             "date": [r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}"],
             "amount": [r"\$[\d,]+\.\d{2}"],  # $1,234.56
         },
@@ -134,18 +302,27 @@ class InvoiceParser:
     def __init__(self, payload: str):
         self.text = payload
         # Use Poppler section if available (cleanest formatting)
-        self.poppler = self._get_section("Poppler pdftotext")
-        self.pdfplumber = self._get_section("Python PdfPlumber")
+        sections = self._get_sections("Poppler pdftotext", "Python PdfPlumber")
+        self.poppler = sections.get("Poppler pdftotext")
+        self.pdfplumber = sections.get("Python PdfPlumber")
         self.best = self.poppler or self.pdfplumber or self.text
 
         # Detect locale early
         self.detected_locale, self.locale_scores = self._detect_locale_detailed()
 
-    def _get_section(self, header: str) -> Optional[str]:
-        """Extract a specific extractor section from the payload."""
-        pattern = rf"{re.escape(header)}\*+\s*(.*?)(?=\n\w+[*]+|\Z)"
-        m = re.search(pattern, self.text, re.DOTALL | re.IGNORECASE)
-        return m.group(1).strip() if m else None
+    def _get_sections(self, *headers: str) -> dict[str, str]:
+        """Extract the given extractor sections from the payload in one scan."""
+        sections = {}
+        for m in _section_headers_pattern(headers).finditer(self.text):
+            header = headers[int(m.lastgroup[1:])]
+            if header in sections:
+                continue
+            # The section runs until the next "Header****" line or the end
+            end = _SECTION_END_PATTERN.search(self.text, m.end())
+            sections[header] = self.text[m.end():end.start() if end else len(self.text)].strip()
+            if len(sections) == len(headers):
+                break
+        return sections
 
     def parse(self) -> dict:
         # Extract all fields (with raw values for confidence)
@@ -160,7 +337,8 @@ class InvoiceParser:
         # Get top locale signals for debugging
         top_signals = []
         if self.locale_scores.get(self.detected_locale):
-            top_signals = self.locale_scores[self.detected_locale].get("matches", [])[:5]
+            top_signals = [f"{category}:{value[:20]}"
+                           for category, value in self.locale_scores[self.detected_locale].get("matches", [])[:5]]
 
         # Compute field confidence based on locale format matching
         raw_values = {
@@ -203,15 +381,8 @@ class InvoiceParser:
 
     def _extract_invoice_number(self) -> Optional[str]:
         """Extract invoice number using common label patterns."""
-        patterns = [
-            r"Invoice\s*number[:\s]+([A-Z0-9\-]+)",
-            r"Fakturanummer[:\s]+([A-Z0-9\-]+)",
-            r"Fakturanr[:\s]+([A-Z0-9\-]+)",
-            r"Invoice\s*#[:\s]*([A-Z0-9\-]+)",
-            r"Invoice[:\s]+([A-Z0-9\-]{4,})",  # At least 4 chars
-        ]
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+        for p in _INVOICE_NUMBER_PATTERNS:
+            m = p.search(self.best)
             if m and len(m.group(1).strip()) >= 3:
                 return m.group(1).strip()
         return None
@@ -219,21 +390,8 @@ class InvoiceParser:
     def _extract_invoice_date(self) -> tuple[Optional[str], Optional[str]]:
         """Extract invoice date and normalize to YYYY-MM-DD.
         Returns (normalized_date, raw_date) tuple."""
-        patterns = [
-            r"Invoice\s*date\s+(\d{4}-\d{2}-\d{2})",  # YYYY-MM-DD
-            r"Invoice\s*date\s+(\d{2}\.\d{2}\.\d{4})",  # DD.MM.YYYY
-            r"Fakturadatum\s+(\d{4}-\d{2}-\d{2})",
-            r"Date\s+of\s+issue\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # Month DD, YYYY with space
-            r"Date\s+of\s+issue([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # Month DD, YYYY no space
-            r"Invoice\s*date\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",
-            r"Order\s+Date[:\s]+(\d{2}/\d{2}/\d{4})",  # US MM/DD/YYYY
-            r"Transaction\s+Date[:\s]+(\d{2}/\d{2}/\d{4})",
-            r"Date[:\s]+(\d{2}/\d{2}/\d{4})",  # Generic US date
-            r"Date[:\s]+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # Date: Jan 06, 2022
-            r"Datum[:\s]+(\d{4}-\d{2}-\d{2})",  # Swedish Datum: YYYY-MM-DD
-        ]
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+        for p in _INVOICE_DATE_PATTERNS:
+            m = p.search(self.best)
             if m:
                 raw = m.group(1).strip()
                 return self._normalize_date(raw), raw
@@ -242,17 +400,8 @@ class InvoiceParser:
     def _extract_due_date(self) -> tuple[Optional[str], Optional[str]]:
         """Extract due date and normalize to YYYY-MM-DD.
         Returns (normalized_date, raw_date) tuple."""
-        patterns = [
-            r"Due\s*date\s+(\d{4}-\d{2}-\d{2})",
-            r"Due\s*date\s+(\d{2}\.\d{2}\.\d{4})",
-            r"Date\s+due\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # with space
-            r"Date\s+due([A-Za-z]+\s+\d{1,2},?\s+\d{4})",  # no space
-            r"Förfallodatum\s+(\d{4}-\d{2}-\d{2})",
-            r"Förfallodag\s+(\d{4}-\d{2}-\d{2})",
-            r"Betala\s+senast\s+(\d{4}-\d{2}-\d{2})",
-        ]
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+        for p in _DUE_DATE_PATTERNS:
+            m = p.search(self.best)
             if m:
                 raw = m.group(1).strip()
                 return self._normalize_date(raw), raw
@@ -261,37 +410,9 @@ class InvoiceParser:
     def _extract_total_amount(self) -> tuple[Optional[float], Optional[str], Optional[str]]:
         """Extract total amount and currency.
         Returns (amount, currency, raw_amount) tuple."""
-        patterns = [
-            # "Total amount 20,907.00 SEK" or "Total amount                               20,907.00 SEK"
-            r"Total\s+amount\s+([0-9,.\s]+)\s*(SEK|EUR|USD|NOK|DKK|GBP)",
-            # "To pay SEK 171,000.00" or "To pay        SEK 171,000.00"
-            r"To\s+pay\s+(SEK|EUR|USD|NOK|DKK|GBP)\s*([0-9,.\s]+)",
-            # "Amount due €14.68"
-            r"Amount\s+due[:\s]*([€$]?)([0-9,.\s]+)",
-            # "Att betala 150 kr" or "Att betala: 150 kr"
-            r"Att\s+betala[:\s]+([0-9,.\s]+)\s*(SEK|kr)?",
-            # "Total price: $150.00 USD" - with $ prefix and currency suffix
-            r"Total\s+price[:\s]+\$([0-9,.\s]+)\s*(USD)?",
-            # "Total price: €14.68" or "Total price:                 $150.00"
-            r"Total\s+price[:\s]+([€$]?)([0-9,.\s]+)",
-            # "Total €14.68" at end of line
-            r"Total\s*([€$]?)([0-9,.\s]+)\s*$",
-            # "€14.68 due"
-            r"([€$])([0-9,.\s]+)\s+due",
-            # "$150.00 USD" standalone pattern
-            r"\$([0-9,.\s]+)\s*(USD)",
-            # "Total: 1537,50" with optional trailing whitespace
-            r"Total:\s+([0-9][0-9,.\s]*[0-9])",
-            # Fallback: "Total" followed by currency and amount
-            r"Total[:\s]+(SEK|EUR|USD|NOK)\s*([0-9,.\s]+)",
-            # "Summa: 1234,56" Swedish total
-            r"Summa[:\s]+([0-9,.\s]+)",
-            # "Belopp: 1234,56" Swedish amount
-            r"Belopp[:\s]+([0-9,.\s]+)\s*(SEK|kr)?",
-        ]
-
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+
+        for p in _TOTAL_AMOUNT_PATTERNS:
+            m = p.search(self.best)
             if m:
                 groups = m.groups()
                 amount_str = None
@@ -300,10 +421,11 @@ class InvoiceParser:
                 for g in groups:
                     if g:
                         g = g.strip()
-                        if re.match(r'^[0-9,.\s]+$', g):
-                            amount_str = g
-                        elif g.upper() in self.CURRENCY_MAP.values() or g in self.CURRENCY_MAP:
+                        # Cheap set lookups first; no currency token is all digits
+                        if g in self.CURRENCY_MAP or g.upper() in _CURRENCY_ISO_SET:
                             currency = self.CURRENCY_MAP.get(g.lower(), g.upper())
+                        elif _AMOUNT_CHARS_PATTERN.match(g):
+                            amount_str = g
 
                 if amount_str:
                     amount = self._parse_amount(amount_str)
@@ -316,39 +438,19 @@ class InvoiceParser:
 
     def _extract_vat(self) -> Optional[float]:
         """Extract VAT/Moms amount."""
-        patterns = [
-            # "VAT (0 %)                                                     0.00"
-            r"VAT\s*\([^)]+\)\s+([0-9,.\s]+)",
-            # "VAT - Sweden (25% on €11.74)                         €2.94"
-            r"VAT\s*-\s*\w+\s*\([^)]+\)\s*([€$]?)([0-9,.\s]+)",
-            # "Moms: 25.00" or "Moms 25.00"
-            r"Moms[:\s]+([0-9,.\s]+)",
-            # "MVA (25%): 500"
-            r"MVA\s*\([^)]+\)[:\s]*([0-9,.\s]+)",
-        ]
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+        for p in _VAT_PATTERNS:
+            m = p.search(self.best)
             if m:
                 for g in m.groups():
-                    if g and re.match(r'^[0-9,.\s]+$', g.strip()):
+                    if g and _AMOUNT_CHARS_PATTERN.match(g.strip()):
                         return self._parse_amount(g.strip())
         return None
 
     def _extract_vendor(self) -> Optional[str]:
         """Extract vendor name from document content (NOT email metadata)."""
         # Look for company patterns - must be on single line, clean format
-        patterns = [
-            # "Invoice    Helleborg AS" pattern
-            r"Invoice\s{2,}([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s]{1,30}(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\s*$",
-            # "From\nAsynkron AB" pattern
-            r"From\n+([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s]{1,30}(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\s*$",
-            # "Anthropic, PBC" at start of line
-            r"^([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ,\s]{1,30}(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\s*$",
-            # Standalone company name line
-            r"\n([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ\s]{2,25}\s(?:AB|AS|Inc|LLC|GmbH|Ltd|PBC|Oy))\n",
-        ]
-        for p in patterns:
-            m = re.search(p, self.best or self.text, re.MULTILINE)
+        for p in _VENDOR_PATTERNS:
+            m = p.search(self.best or self.text)
             if m:
                 name = m.group(1).strip()
                 # Validate: no newlines, reasonable length, not just suffix
@@ -358,13 +460,8 @@ class InvoiceParser:
 
     def _extract_customer(self) -> Optional[str]:
         """Extract customer/bill-to name."""
-        patterns = [
-            r"Bill\s+to[:\s]+([A-Za-zÀ-ÿ\s]+(?:AB|AS|Inc|Organization)?)",
-            r"Invoice\s+address\s+([A-Za-zÀ-ÿ\s]+(?:AB|AS|as))",
-            r"Kund[:\s]+([A-Za-zÀ-ÿ\s]+(?:AB|AS))",
-        ]
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+        for p in _CUSTOMER_PATTERNS:
+            m = p.search(self.best)
             if m:
                 name = m.group(1).strip()
                 if len(name) > 2:
@@ -373,66 +470,55 @@ class InvoiceParser:
 
     def _extract_org_number(self, is_vendor: bool) -> Optional[str]:
         """Extract organization number (Swedish, Norwegian, etc.)."""
-        patterns = [
-            r"(?:Org\.?\s*(?:nr|no|nummer)?|Corporate\s+identity\s+no\.?)[:\s]+([A-Z]{0,2}\s*[\d\s\-]+)",
-            r"VAT\s+(?:identification\s+)?number[:\s]+([A-Z]{2}\d+)",
-            r"(\d{6}-\d{4})",  # Swedish format
-            r"(NO\s*\d{3}\s*\d{3}\s*\d{3}\s*MVA)",  # Norwegian format
-        ]
-        for p in patterns:
-            m = re.search(p, self.best, re.IGNORECASE)
+        for p in _ORG_NUMBER_PATTERNS:
+            m = p.search(self.best)
             if m:
                 return m.group(1).strip()
         return None
 
     # Month name to number mapping
-    MONTHS = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12,
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        # Swedish
-        "januari": 1, "februari": 2, "mars": 3, "april": 4,
-        "maj": 5, "juni": 6, "juli": 7, "augusti": 8,
-        "september": 9, "oktober": 10, "november": 11, "december": 12,
-    }
+    MONTHS = _MONTHS
 
     def _normalize_date(self, date_str: str) -> Optional[str]:
         """Normalize date to YYYY-MM-DD format."""
         date_str = date_str.strip()
 
-        # Already in correct format
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-            return date_str
-
-        # DD.MM.YYYY -> YYYY-MM-DD (European)
-        m = re.match(r'^(\d{2})\.(\d{2})\.(\d{4})$', date_str)
-        if m:
-            return f"{m.group(3)}-{m.group(2)}-{m.group(1)}"
-
-        # MM/DD/YYYY -> YYYY-MM-DD (US format)
-        m = re.match(r'^(\d{2})/(\d{2})/(\d{4})$', date_str)
-        if m:
-            return f"{m.group(3)}-{m.group(1)}-{m.group(2)}"
+        # Numeric formats are all 10 characters; tell them apart by separator
+        if len(date_str) == 10:
+            sep = date_str[2]
+
+            # Already in correct format
+            if date_str[4] == "-" and date_str[7] == "-":
+                if (date_str[:4] + date_str[5:7] + date_str[8:]).isdecimal():
+                    return date_str
+
+            elif sep in "./" and date_str[5] == sep:
+                day_month = date_str[:2] + date_str[3:5]
+                year = date_str[6:]
+                if (day_month + year).isdecimal():
+                    if sep == ".":
+                        # DD.MM.YYYY -> YYYY-MM-DD (European)
+                        return f"{year}-{date_str[3:5]}-{date_str[:2]}"
+                    # MM/DD/YYYY -> YYYY-MM-DD (US format)
+                    return f"{year}-{date_str[:2]}-{date_str[3:5]}"
 
         # "Month DD, YYYY" or "Month DD YYYY" -> YYYY-MM-DD
-        m = re.match(r'^([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})$', date_str)
+        m = _MONTH_DAY_YEAR_PATTERN.match(date_str)
         if m:
             month_name = m.group(1).lower()
             day = int(m.group(2))
             year = int(m.group(3))
-            month = self.MONTHS.get(month_name)
+            month = _MONTHS.get(month_name)
             if month:
                 return f"{year}-{month:02d}-{day:02d}"
 
         # "DD Month YYYY" -> YYYY-MM-DD
-        m = re.match(r'^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$', date_str)
+        m = _DAY_MONTH_YEAR_PATTERN.match(date_str)
         if m:
             day = int(m.group(1))
             month_name = m.group(2).lower()
             year = int(m.group(3))
-            month = self.MONTHS.get(month_name)
+            month = _MONTHS.get(month_name)
             if month:
                 return f"{year}-{month:02d}-{day:02d}"
 
@@ -481,10 +567,15 @@ class InvoiceParser:
 
     def _find_currency(self) -> Optional[str]:
         """Find currency mentioned in document."""
-        for word, iso in self.CURRENCY_MAP.items():
-            if re.search(rf'\b{re.escape(word)}\b', self.text, re.IGNORECASE):
-                return iso
-        return None
+        # One scan for all words; CURRENCY_MAP order decides between hits
+        best = None
+        for m in _CURRENCY_PATTERN.finditer(self.text):
+            rank = int(m.lastgroup[1:])
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        return _CURRENCY_ISO_CODES[best] if best is not None else None
 
     def _detect_locale_detailed(self) -> tuple[str, dict]:
         """
@@ -492,38 +583,48 @@ class InvoiceParser:
         Returns (best_locale, scores_dict).
         """
         scores = {}
+        best = None
+        best_score = -1
         text = self.best or self.text
+        word_signals = _find_word_signals(text)
 
-        for locale, signals in self.LOCALE_SIGNALS.items():
+        for locale, signals in _COMPILED_LOCALE_SIGNALS.items():
             score = 0
             matches = []
 
             for category, patterns in signals.items():
                 # Weight different categories
-                weight = {
-                    "currency": 2,      # Medium signal (can be different from locale)
-                    "company": 4,       # Strong signal - company suffix is very telling
-                    "labels": 2,        # Good signal
-                    "org_number": 5,    # Very strong signal - definitive
-                    "address": 3,       # Good signal for US (state + zip)
-                    "city": 4,          # Strong signal - major US cities
-                    "date": 1,          # Weak (formats overlap)
-                    "amount": 1,        # Weak (formats overlap)
-                }.get(category, 1)
-
-                for pattern in patterns:
-                    found = re.findall(pattern, text, re.IGNORECASE)
-                    if found:
-                        score += weight * len(found)
-                        matches.append(f"{category}:{found[0][:20]}")
-
-            scores[locale] = {"score": score, "matches": matches[:5]}
-
-        # Find best locale
-        best = max(scores.keys(), key=lambda k: scores[k]["score"])
+                weight = _CATEGORY_WEIGHTS.get(category, 1)
+
+                for index, pattern in enumerate(patterns):
+                    key = (locale, category, index)
+                    if key in _WORD_SIGNALS:
+                        hit = word_signals.get(key)
+                        if hit is None:
+                            continue
+                        first, count = hit
+                    else:
+                        # Only the first match and the count are needed
+                        it = pattern.finditer(text)
+                        m = next(it, None)
+                        if m is None:
+                            continue
+                        first = m.group()
+                        count = 1 + sum(1 for _ in it)
+
+                    score += weight * count
+                    # Formatted in parse(), and only for the winning locale
+                    if len(matches) < 5:
+                        matches.append((category, first))
+
+            scores[locale] = {"score": score, "matches": matches}
+
+            # Track the best locale as we go (first one wins ties)
+            if score > best_score:
+                best, best_score = locale, score
 
         # Default to en-US if no strong signals
-        if scores[best]["score"] < 2:
+        if best_score < 2:
             best = "en-US"
 
         return best, scores
@@ -546,8 +647,8 @@ class InvoiceParser:
         # Check amount format
         if raw_values.get("total_amount_raw"):
             raw = raw_values["total_amount_raw"]
-            expected_pattern = formats.get("amount_pattern")
-            if expected_pattern and re.match(expected_pattern, raw):
+            expected_pattern = _LOCALE_AMOUNT_PATTERN.get(locale)
+            if expected_pattern and expected_pattern.match(raw):
                 confidence["total_amount"] = {
                     "confidence": 1.0,
                     "reason": f"Format matches {locale} pattern"
@@ -555,12 +656,10 @@ class InvoiceParser:
             elif expected_pattern:
                 # Check if it matches another locale's pattern
                 other_match = None
-                for other_locale, other_formats in self.LOCALE_FORMATS.items():
-                    if other_locale != locale:
-                        other_pattern = other_formats.get("amount_pattern")
-                        if other_pattern and re.match(other_pattern, raw):
-                            other_match = other_locale
-                            break
+                for other_locale, other_pattern in _LOCALE_AMOUNT_PATTERN.items():
+                    if other_locale != locale and other_pattern.match(raw):
+                        other_match = other_locale
+                        break
                 if other_match:
                     confidence["total_amount"] = {
                         "confidence": 0.6,
@@ -599,9 +698,9 @@ class InvoiceParser:
             raw_key = f"{date_field}_raw"
             if raw_values.get(raw_key):
                 raw = raw_values[raw_key]
-                date_patterns = formats.get("date_patterns", [])
+                date_patterns = _LOCALE_DATE_PATTERNS.get(locale, ())
 
-                if any(re.match(p, raw) for p in date_patterns):
+                if any(p.match(raw) for p in date_patterns):
                     confidence[date_field] = {
                         "confidence": 1.0,
                         "reason": f"Date format matches {locale} pattern"
@@ -609,12 +708,10 @@ class InvoiceParser:
                 else:
                     # Check if it matches another locale
                     other_match = None
-                    for other_locale, other_formats in self.LOCALE_FORMATS.items():
-                        if other_locale != locale:
-                            other_patterns = other_formats.get("date_patterns", [])
-                            if any(re.match(p, raw) for p in other_patterns):
-                                other_match = other_locale
-                                break
+                    for other_locale, other_patterns in _LOCALE_DATE_PATTERNS.items():
+                        if other_locale != locale and any(p.match(raw) for p in other_patterns):
+                            other_match = other_locale
+                            break
                     if other_match:
                         confidence[date_field] = {
                             "confidence": 0.7,
@@ -630,19 +727,16 @@ class InvoiceParser:
 
     def _build_anchors(self, vendor: Optional[str]) -> list[str]:
         """Build static identification anchors found verbatim in text."""
-        candidates = [
-            "Invoice number", "Invoice date", "Due date", "Total amount",
-            "Fakturanummer", "Fakturadatum", "Förfallodatum", "Att betala",
-            "Amount due", "Bill to", "VAT", "Moms", "Bankgiro", "IBAN",
-            "Date of issue", "Date due", "Subtotal",
-        ]
-
         anchors = []
         if vendor and vendor in self.text:
             anchors.append(vendor)
 
-        for c in candidates:
-            if c in self.text and c not in anchors:
+        # One scan for all candidates; the ones another match can hide are
+        # checked on their own
+        found = set(_ANCHOR_PATTERN.findall(self.text))
+        for c in _ANCHOR_CANDIDATES:
+            present = c in found or (c in _OVERLAPPABLE_ANCHORS and c in self.text)
+            if present and c not in anchors:
                 anchors.append(c)
                 if len(anchors) >= 6:
                     break
@@ -650,13 +744,106 @@ class InvoiceParser:
         return anchors
 
 
+# CURRENCY_MAP words as one alternation, group "c<i>" being the i-th entry
+_CURRENCY_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(f"(?P<c{i}>{re.escape(word)})" for i, word in enumerate(InvoiceParser.CURRENCY_MAP))
+    + r")\b",
+    re.IGNORECASE,
+)
+_CURRENCY_ISO_CODES = tuple(InvoiceParser.CURRENCY_MAP.values())
+_CURRENCY_ISO_SET = frozenset(_CURRENCY_ISO_CODES)
+
+# Static identification anchor candidates, in priority order
+_ANCHOR_CANDIDATES = (
+    "Invoice number", "Invoice date", "Due date", "Total amount",
+    "Fakturanummer", "Fakturadatum", "Förfallodatum", "Att betala",
+    "Amount due", "Bill to", "VAT", "Moms", "Bankgiro", "IBAN",
+    "Date of issue", "Date due", "Subtotal",
+)
+_ANCHOR_PATTERN = re.compile("|".join(re.escape(c) for c in _ANCHOR_CANDIDATES))
+# Candidates whose start can overlap the end of another ("VAT" / "Total amount"),
+# so a non-overlapping scan may skip them
+_OVERLAPPABLE_ANCHORS = frozenset(
+    b for a in _ANCHOR_CANDIDATES for b in _ANCHOR_CANDIDATES
+    if a != b and (b in a or any(a.endswith(b[:k]) for k in range(1, len(b))))
+)
+
+# LOCALE_FORMATS patterns, compiled for _compute_field_confidence
+_LOCALE_DATE_PATTERNS = {
+    locale: tuple(re.compile(p) for p in formats.get("date_patterns", []))
+    for locale, formats in InvoiceParser.LOCALE_FORMATS.items()
+}
+_LOCALE_AMOUNT_PATTERN = {
+    locale: re.compile(formats["amount_pattern"])
+    for locale, formats in InvoiceParser.LOCALE_FORMATS.items()
+    if formats.get("amount_pattern")
+}
+
+# LOCALE_SIGNALS with every pattern compiled (case-insensitive)
+_COMPILED_LOCALE_SIGNALS = {
+    locale: {
+        category: tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+        for category, patterns in signals.items()
+    }
+    for locale, signals in InvoiceParser.LOCALE_SIGNALS.items()
+}
+
+# Signals that are a single literal word (e.g. r"\bMoms\b") are all counted in
+# one scan. Distinct whole words never overlap, so the counts are the same as
+# running each pattern on its own.
+def _word_signal_keys() -> dict[str, list[tuple[str, str, int]]]:
+    """Map each single-word signal to its (locale, category, index) keys."""
+    keys = {}
+    for locale, signals in InvoiceParser.LOCALE_SIGNALS.items():
+        for category, patterns in signals.items():
+            for index, pattern in enumerate(patterns):
+                word = re.fullmatch(r"\\b(\w+)\\b", pattern)
+                if word:
+                    keys.setdefault(word.group(1).lower(), []).append((locale, category, index))
+    return keys
+
+
+_WORD_SIGNAL_KEYS = _word_signal_keys()
+_WORD_SIGNAL_GROUPS = {f"w{i}": keys for i, keys in enumerate(_WORD_SIGNAL_KEYS.values())}
+_WORD_SIGNAL_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(f"(?P<w{i}>{re.escape(word)})" for i, word in enumerate(_WORD_SIGNAL_KEYS))
+    + r")\b",
+    re.IGNORECASE,
+)
+_WORD_SIGNALS = frozenset(key for keys in _WORD_SIGNAL_KEYS.values() for key in keys)
+
+
+def _find_word_signals(text: str) -> dict[tuple[str, str, int], list]:
+    """Collect [first match, count] of every single-word locale signal in one pass."""
+    found = {}
+    for m in _WORD_SIGNAL_PATTERN.finditer(text):
+        for key in _WORD_SIGNAL_GROUPS[m.lastgroup]:
+            hit = found.get(key)
+            if hit is None:
+                found[key] = [m.group(), 1]
+            else:
+                hit[1] += 1
+    return found
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print(json.dumps({"error": "Usage: parser.py <payload.txt>"}))
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "Usage: parser.py <payload.txt> [<payload.txt> ...]"}))
         sys.exit(1)
 
-    with open(sys.argv[1], "r", encoding="utf-8") as f:
-        payload = f.read()
+    if len(sys.argv) == 2:
+        with open(sys.argv[1], "r", encoding="utf-8") as f:
+            payload = f.read()
+
+        result = InvoiceParser(payload).parse()
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        sys.exit(0)
 
-    result = InvoiceParser(payload).parse()
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    # Several payloads: one JSON object per line, in argument order, so the
+    # import and pattern compilation are paid once for the whole batch
+    for path in sys.argv[1:]:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = f.read()
+        print(json.dumps(InvoiceParser(payload).parse(), ensure_ascii=False))
@@ -2,19 +2,29 @@
 Output formatting utilities for processed text blocks.
 """
 
+import re
+
+_MULTI_BLANK_PATTERN = re.compile(r"\n{3,}")
+
 
 def is_label_line(line: str) -> bool:
     """Check if a line is a label:value pair (not a URL or other colon usage)."""
-    if ":" not in line or not line.strip():
-        return False
+    return _label_colon_pos(line) >= 0
+
+
+def _label_colon_pos(line: str) -> int:
+    """Return the position of the label colon in a label:value line, or -1."""
+    # A line holding a colon is never blank
+    colon_pos = line.find(":")
+    if colon_pos < 0:
+        return -1
     # Skip URLs
-    if line.startswith("http://") or line.startswith("https://"):
-        return False
+    if line.startswith(("http://", "https://")):
+        return -1
     # Skip if colon is preceded by // (URL scheme)
-    colon_pos = line.index(":")
-    if colon_pos >= 2 and line[colon_pos - 1] == "/" and line[colon_pos - 2] == "/":
-        return False
-    return True
+    if colon_pos >= 2 and line[colon_pos - 2 : colon_pos] == "//":
+        return -1
+    return colon_pos
 
 
 def align_key_value_groups(text: str) -> str:
@@ -22,7 +32,11 @@ def align_key_value_groups(text: str) -> str:
     Align key:value pairs in consecutive labeled lines.
     Pads after ':' so values line up.
     """
-    lines = text.split("\n")
+    return "\n".join(_align_key_value_lines(text.split("\n")))
+
+
+def _align_key_value_lines(lines: list[str]) -> list[str]:
+    """Align key:value pairs in consecutive labeled lines of a split text."""
     result = []
     i = 0
 
@@ -30,63 +44,55 @@ def align_key_value_groups(text: str) -> str:
         # Find consecutive label:value lines
         group = []
 
-        while i < len(lines) and is_label_line(lines[i]):
-            group.append(lines[i])
+        while i < len(lines):
+            colon_pos = _label_colon_pos(lines[i])
+            if colon_pos < 0:
+                break
+            group.append((lines[i], colon_pos))
             i += 1
 
         if len(group) >= 2:
             # Find max label width (part before first ':')
-            max_label_width = 0
-            for line in group:
-                colon_pos = line.index(":")
-                max_label_width = max(max_label_width, colon_pos)
+            max_label_width = max(colon_pos for _, colon_pos in group)
 
             # Reformat with aligned values
-            for line in group:
-                colon_pos = line.index(":")
+            for line, colon_pos in group:
                 label = line[:colon_pos]
                 value = line[colon_pos + 1 :].lstrip()
-                padding = " " * (max_label_width - len(label))
+                padding = " " * (max_label_width - colon_pos)
                 result.append(f"{label}{padding}: {value}")
         elif group:
-            result.extend(group)
+            result.append(group[0][0])
         else:
             result.append(lines[i])
             i += 1
 
-    return "\n".join(result)
+    return result
 
 
 def collapse_blank_lines(text: str) -> str:
     """Collapse multiple blank lines to single blank line."""
-    while "\n\n\n" in text:
-        text = text.replace("\n\n\n", "\n\n")
-    return text
+    return _MULTI_BLANK_PATTERN.sub("\n\n", text)
 
 
 def collapse_between_labels(text: str) -> str:
     """Remove blank lines between consecutive labeled lines."""
-    lines = text.split("\n")
-    result = []
-    i = 0
+    return "\n".join(_collapse_between_label_lines(text.split("\n")))
 
-    while i < len(lines):
-        line = lines[i]
-        # Check if this is a blank line between two labeled lines
-        if (
-            not line.strip()
-            and result
-            and i + 1 < len(lines)
-            and ":" in result[-1]
-            and ":" in lines[i + 1]
-        ):
-            # Skip the blank line
-            i += 1
-            continue
-        result.append(line)
-        i += 1
 
-    return "\n".join(result)
+def _collapse_between_label_lines(lines: list[str]) -> list[str]:
+    """Remove blank lines between consecutive labeled lines of a split text."""
+    # A skipped blank line is always followed by a labeled line, so the kept
+    # line before a blank one is simply the previous line
+    last = len(lines) - 1
+    return [
+        line
+        for i, line in enumerate(lines)
+        if (line and not line.isspace())
+        or not 0 < i < last
+        or ":" not in lines[i - 1]
+        or ":" not in lines[i + 1]
+    ]
 
 
 def format_output(blocks: list[str]) -> str:
@@ -101,6 +107,8 @@ def format_output(blocks: list[str]) -> str:
     """
     output = "\n\n".join(blocks)
     output = collapse_blank_lines(output)
-    output = collapse_between_labels(output)
-    output = align_key_value_groups(output)
-    return output
+    # Split once and hand the lines from stage to stage
+    lines = output.split("\n")
+    lines = _collapse_between_label_lines(lines)
+    lines = _align_key_value_lines(lines)
+    return "\n".join(lines)
@@ -4,7 +4,20 @@ Core parsing logic for extracting text blocks from documents.
 
 from __future__ import annotations
 
+import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+_NON_BLANK_PATTERN = re.compile(r"[^ ]")
+_NON_BLANK_RUN_PATTERN = re.compile(r"1+")
+_GAP_RUN_PATTERN = re.compile(r"0+")
+_PDF_PAGES_PATTERN = re.compile(r"^Pages:\s+(\d+)", re.MULTILINE)
+
+# With parallel conversion, PDFs with at least this many pages are split into
+# page ranges; smaller files are not even probed for their page count
+_PARALLEL_MIN_PAGES = 8
+_PARALLEL_MIN_BYTES = 256 * 1024
 
 
 def text_to_matrix(text: str) -> list[list[str]]:
@@ -14,106 +27,133 @@ def text_to_matrix(text: str) -> list[list[str]]:
     return [list(line.ljust(max_width)) for line in lines]
 
 
-def is_blank_row(matrix: list[list[str]], row: int) -> bool:
+def _as_rows(matrix: list[str] | list[list[str]]) -> list[str]:
+    """Turn the rows of a character matrix into strings, which the scans work on."""
+    return [row if isinstance(row, str) else "".join(row) for row in matrix]
+
+
+def is_blank_row(matrix: list[str] | list[list[str]], row: int) -> bool:
     """Check if a row is entirely whitespace."""
-    return all(c in (" ", "") for c in matrix[row])
+    return not "".join(matrix[row]).strip(" ")
 
 
 def is_blank_col(
-    matrix: list[list[str]], col: int, start_row: int, end_row: int
+    matrix: list[str] | list[list[str]], col: int, start_row: int, end_row: int
 ) -> bool:
     """Check if a column is entirely whitespace within the row range."""
-    return all(matrix[r][col] in (" ", "") for r in range(start_row, end_row + 1))
+    for r in range(start_row, end_row + 1):
+        row = matrix[r]
+        if col < len(row) and row[col] not in (" ", ""):
+            return False
+    return True
 
 
-def split_horizontal(matrix: list[list[str]]) -> list[tuple[int, int]]:
+def split_horizontal(matrix: list[str] | list[list[str]]) -> list[tuple[int, int]]:
     """Split matrix into horizontal sections based on blank rows."""
-    if not matrix:
-        return []
-
-    sections = []
-    in_section = False
-    section_start = 0
-
-    for r in range(len(matrix)):
-        if is_blank_row(matrix, r):
-            if in_section:
-                sections.append((section_start, r - 1))
-                in_section = False
-        elif not in_section:
-            section_start = r
-            in_section = True
-
-    if in_section:
-        sections.append((section_start, len(matrix) - 1))
-
-    return sections
+    return _split_horizontal(_as_rows(matrix))
 
 
 def find_vertical_gaps(
-    matrix: list[list[str]], start_row: int, end_row: int, min_gap: int
+    matrix: list[str] | list[list[str]], start_row: int, end_row: int, min_gap: int
 ) -> list[tuple[int, int]]:
     """Find vertical whitespace gaps within a row range."""
-    if not matrix or not matrix[0]:
-        return []
-
-    width = len(matrix[0])
-    gaps = []
-    in_gap = False
-    gap_start = 0
-
-    for c in range(width):
-        if is_blank_col(matrix, c, start_row, end_row):
-            if not in_gap:
-                gap_start = c
-                in_gap = True
-        elif in_gap:
-            if c - gap_start >= min_gap:
-                gaps.append((gap_start, c - 1))
-            in_gap = False
-
-    return gaps
+    non_blank_cols = _non_blank_columns(_as_rows(matrix), start_row, end_row)
+    return _find_vertical_gaps(non_blank_cols, min_gap)
 
 
 def find_text_bounds(
-    matrix: list[list[str]], start_row: int, end_row: int, start_col: int, end_col: int
+    matrix: list[str] | list[list[str]],
+    start_row: int,
+    end_row: int,
+    start_col: int,
+    end_col: int,
 ) -> tuple[int, int] | None:
     """Find actual text bounds within a region. Returns (min_col, max_col) or None."""
-    min_c, max_c = end_col + 1, start_col - 1
-    for r in range(start_row, end_row + 1):
-        for c in range(start_col, end_col):
-            if matrix[r][c] not in (" ", ""):
-                min_c = min(min_c, c)
-                max_c = max(max_c, c)
-    return (min_c, max_c) if max_c >= min_c else None
+    non_blank_cols = _non_blank_columns(_as_rows(matrix), start_row, end_row)
+    return _find_text_bounds(non_blank_cols, start_col, end_col)
 
 
 def split_vertical(
-    matrix: list[list[str]], start_row: int, end_row: int, min_gap: int
+    matrix: list[str] | list[list[str]], start_row: int, end_row: int, min_gap: int
 ) -> list[tuple[int, int]]:
     """Split a section into vertical columns based on whitespace gaps."""
-    if not matrix or not matrix[0]:
+    return _split_vertical(_as_rows(matrix), start_row, end_row, min_gap)
+
+
+def _non_blank_columns(matrix: list[str], start_row: int, end_row: int) -> str:
+    """Mark each column holding text within the row range with "1", else "0"."""
+    rows = matrix[start_row : end_row + 1]
+    width = max(map(len, rows), default=0)
+    if not width:
+        return ""
+
+    # OR the rows together as binary numbers, one bit per column; rows may be
+    # ragged, so shorter ones are shifted to line up on the left
+    mask = 0
+    for row in rows:
+        bits = _NON_BLANK_PATTERN.sub("1", row).replace(" ", "0")
+        if bits:
+            mask |= int(bits, 2) << (width - len(row))
+    return format(mask, f"0{width}b")
+
+
+def _split_horizontal(matrix: list[str]) -> list[tuple[int, int]]:
+    """Split string rows into horizontal sections based on blank rows."""
+    non_blank_rows = "".join("1" if row.strip(" ") else "0" for row in matrix)
+    return [
+        (run.start(), run.end() - 1)
+        for run in _NON_BLANK_RUN_PATTERN.finditer(non_blank_rows)
+    ]
+
+
+def _find_vertical_gaps(non_blank_cols: str, min_gap: int) -> list[tuple[int, int]]:
+    """Find vertical whitespace gaps in a column mask."""
+    # A gap running to the right edge does not separate columns
+    text_end = len(non_blank_cols.rstrip("0"))
+    return [
+        (gap.start(), gap.end() - 1)
+        for gap in _GAP_RUN_PATTERN.finditer(non_blank_cols, 0, text_end)
+        if gap.end() - gap.start() >= min_gap
+    ]
+
+
+def _find_text_bounds(
+    non_blank_cols: str, start_col: int, end_col: int
+) -> tuple[int, int] | None:
+    """Find text bounds within a column range of a column mask."""
+    min_c = non_blank_cols.find("1", start_col, end_col)
+    if min_c == -1:
+        return None
+    return min_c, non_blank_cols.rfind("1", start_col, end_col)
+
+
+def _split_vertical(
+    matrix: list[str], start_row: int, end_row: int, min_gap: int
+) -> list[tuple[int, int]]:
+    """Split a section of string rows into columns based on whitespace gaps."""
+    if not matrix:
         return []
 
-    width = len(matrix[0])
-    gaps = find_vertical_gaps(matrix, start_row, end_row, min_gap)
+    non_blank_cols = _non_blank_columns(matrix, start_row, end_row)
+    width = len(non_blank_cols)
+    gaps = _find_vertical_gaps(non_blank_cols, min_gap)
 
     if not gaps:
-        bounds = find_text_bounds(matrix, start_row, end_row, 0, width)
+        bounds = _find_text_bounds(non_blank_cols, 0, width)
         return [bounds] if bounds else []
 
     columns = []
     prev_end = 0
 
     for gap_start, gap_end in gaps:
-        bounds = find_text_bounds(matrix, start_row, end_row, prev_end, gap_start)
+        bounds = _find_text_bounds(non_blank_cols, prev_end, gap_start)
         if bounds:
             columns.append(bounds)
         prev_end = gap_end + 1
 
     # Last column
     if prev_end < width:
-        bounds = find_text_bounds(matrix, start_row, end_row, prev_end, width)
+        bounds = _find_text_bounds(non_blank_cols, prev_end, width)
         if bounds:
             columns.append(bounds)
 
@@ -134,80 +174,91 @@ def normalize_block(lines: list[str]) -> str:
         if not first.endswith(":") and ":" not in first and not first[0].isdigit():
             lines = [f"{first}:", non_empty[1]]
 
-    # Join lines where previous ends with ':'
+    # Join label lines, pull up numbers and unwrap wrapped lines in one pass;
+    # each merge checks the end of the line built so far
     result = []
+    separators = (":", ")", "]", "}", ",")
+    end_punctuation = (".", "!", "?", ":", ";")
     i = 0
     while i < len(lines):
         line = lines[i]
-        if line.endswith(":") and i + 1 < len(lines) and lines[i + 1]:
-            result.append(f"{line} {lines[i + 1]}")
-            i += 2
-        else:
-            result.append(line)
+        i += 1
+
+        # Join lines where previous ends with ':'
+        if line.endswith(":") and i < len(lines) and lines[i]:
+            line = f"{line} {lines[i]}"
             i += 1
 
-    # Pull up lines starting with number/minus if prev ends with separator
-    final = []
-    separators = (":", ")", "]", "}", ",")
-    for line in result:
-        if (
-            line
-            and final
-            and final[-1]
-            and (line[0].isdigit() or line[0] == "-")
-            and final[-1].rstrip().endswith(separators)
-        ):
-            final[-1] = f"{final[-1]} {line}"
-        else:
-            final.append(line)
-
-    # Join wrapped lines (line doesn't end with sentence-ending punctuation,
-    # and next line starts with lowercase or is a continuation)
-    unwrapped = []
-    end_punctuation = (".", "!", "?", ":", ";")
-    for line in final:
-        if (
-            line
-            and unwrapped
-            and unwrapped[-1]
-            and not unwrapped[-1].rstrip().endswith(end_punctuation)
-            and (line[0].islower() or line[0].isdigit())
-        ):
-            unwrapped[-1] = f"{unwrapped[-1]} {line}"
-        else:
-            unwrapped.append(line)
+        if line and result and result[-1]:
+            prev_end = result[-1].rstrip()
+            # Pull up lines starting with number/minus if prev ends with separator,
+            # join wrapped lines (prev doesn't end with sentence-ending punctuation,
+            # and line starts with lowercase or is a continuation)
+            if (
+                (line[0].isdigit() or line[0] == "-") and prev_end.endswith(separators)
+            ) or (
+                not prev_end.endswith(end_punctuation)
+                and (line[0].islower() or line[0].isdigit())
+            ):
+                result[-1] = f"{result[-1]} {line}"
+                continue
+
+        result.append(line)
 
-    return "\n".join(unwrapped)
+    return "\n".join(result)
 
 
 def extract_block(
-    matrix: list[list[str]], start_row: int, end_row: int, start_col: int, end_col: int
+    matrix: list[str] | list[list[str]],
+    start_row: int,
+    end_row: int,
+    start_col: int,
+    end_col: int,
 ) -> str:
     """Extract and normalize text from a rectangular region."""
-    lines = []
-    for r in range(start_row, end_row + 1):
-        line = "".join(matrix[r][start_col : end_col + 1]).strip()
-        lines.append(line)
+    return _extract_block(
+        _as_rows(matrix[start_row : end_row + 1]),
+        0,
+        end_row - start_row,
+        start_col,
+        end_col,
+    )
+
+
+def _extract_block(
+    matrix: list[str], start_row: int, end_row: int, start_col: int, end_col: int
+) -> str:
+    """Extract and normalize text from a rectangular region of string rows."""
+    lines = [
+        matrix[r][start_col : end_col + 1].strip()
+        for r in range(start_row, end_row + 1)
+    ]
 
     # Trim blank lines
-    while lines and not lines[0]:
-        lines.pop(0)
-    while lines and not lines[-1]:
-        lines.pop()
+    first, last = 0, len(lines)
+    while first < last and not lines[first]:
+        first += 1
+    while last > first and not lines[last - 1]:
+        last -= 1
 
-    return normalize_block(lines)
+    return normalize_block(lines[first:last])
 
 
-def detect_blocks(matrix: list[list[str]], min_gap: int = 2) -> list[str]:
+def detect_blocks(matrix: list[str] | list[list[str]], min_gap: int = 2) -> list[str]:
     """
     Detect text blocks using XY-Cut algorithm.
     Returns list of normalized text blocks.
     """
+    return _detect_blocks(_as_rows(matrix), min_gap)
+
+
+def _detect_blocks(matrix: list[str], min_gap: int) -> list[str]:
+    """Detect text blocks in a matrix whose rows are strings."""
     blocks = []
 
-    for start_row, end_row in split_horizontal(matrix):
-        for start_col, end_col in split_vertical(matrix, start_row, end_row, min_gap):
-            content = extract_block(matrix, start_row, end_row, start_col, end_col)
+    for start_row, end_row in _split_horizontal(matrix):
+        for start_col, end_col in _split_vertical(matrix, start_row, end_row, min_gap):
+            content = _extract_block(matrix, start_row, end_row, start_col, end_col)
             if content.strip():
                 blocks.append(content)
 
@@ -225,8 +276,8 @@ def process_document(text: str, min_gap: int = 2) -> list[str]:
     Returns:
         List of normalized text blocks
     """
-    matrix = text_to_matrix(text)
-    return detect_blocks(matrix, min_gap)
+    # The scans handle ragged rows, so the lines need no padding
+    return _detect_blocks(text.split("\n"), min_gap)
 
 
 def extract(text: str, min_gap: int = 2) -> str:
@@ -246,32 +297,105 @@ def extract(text: str, min_gap: int = 2) -> str:
     return format_output(blocks)
 
 
-def extract_pdf(pdf_file_path: str, min_gap: int = 2) -> str:
+def extract_pdf(pdf_file_path: str, min_gap: int = 2, parallel: bool = False) -> str:
     """
     Extract text blocks from a PDF using Poppler's pdftotext.
 
     Args:
         pdf_file_path: Path to the PDF file
         min_gap: Minimum whitespace column width to split on (default: 2)
+        parallel: Convert long documents in parallel page ranges; needs
+            Poppler's pdfinfo as well (default: False)
 
     Returns:
         Formatted text output from detected blocks
     """
+    from .formatter import format_output
+
+    blocks = process_document(_pdf_to_text(pdf_file_path, parallel), min_gap)
+    return format_output(blocks)
+
+
+def _pdf_to_text(pdf_file_path: str, parallel: bool = False) -> str:
+    """
+    Convert a PDF to layout-preserved text with Poppler's pdftotext.
+
+    With parallel set, long documents are split into page ranges that
+    separate pdftotext processes convert in parallel. Running pdfinfo to
+    count the pages costs a process start, so only files large enough to
+    hold a long document are probed.
+    """
+    if not parallel:
+        return _run_pdftotext(pdf_file_path)
+
+    try:
+        size = os.path.getsize(pdf_file_path)
+    except OSError:
+        # Let pdftotext report the missing or unreadable file
+        return _run_pdftotext(pdf_file_path)
+    if size < _PARALLEL_MIN_BYTES:
+        return _run_pdftotext(pdf_file_path)
+
+    pages = _pdf_page_count(pdf_file_path) or 0
+    workers = min(os.cpu_count() or 1, pages)
+    if pages < _PARALLEL_MIN_PAGES or workers < 2:
+        return _run_pdftotext(pdf_file_path)
+
+    return _run_pdftotext_in_ranges(pdf_file_path, pages, workers)
+
+
+def _run_pdftotext_in_ranges(pdf_file_path: str, pages: int, workers: int) -> str:
+    """Convert pages 1..pages in one page range per worker and join the texts."""
+    size = -(-pages // workers)
+    ranges = [
+        (first, min(first + size - 1, pages)) for first in range(1, pages + 1, size)
+    ]
+
+    # The work happens in the pdftotext processes, threads only wait on them
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        texts = executor.map(
+            lambda page_range: _run_pdftotext(
+                pdf_file_path, "-f", str(page_range[0]), "-l", str(page_range[1])
+            ),
+            ranges,
+        )
+        return "".join(texts)
+
+
+def _pdf_page_count(pdf_file_path: str) -> int | None:
+    """Read the page count of a PDF with pdfinfo, or None if that fails."""
     try:
         result = subprocess.run(
-            ["pdftotext", "-layout", pdf_file_path, "-"],
+            ["pdfinfo", pdf_file_path], check=False, capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        return None
+
+    match = _PDF_PAGES_PATTERN.search(result.stdout)
+    if result.returncode != 0 or not match:
+        return None
+    return int(match.group(1))
+
+
+def _run_pdftotext(pdf_file_path: str, *options: str) -> str:
+    """Run pdftotext -layout with extra options and return its output."""
+    try:
+        result = subprocess.run(
+            ["pdftotext", "-layout", *options, pdf_file_path, "-"],
             check=False,
             capture_output=True,
-            text=True,
         )
     except FileNotFoundError as exc:
         raise RuntimeError("pdftotext is not installed or not on PATH") from exc
 
     if result.returncode != 0:
-        error = result.stderr.strip() or "Unknown pdftotext error"
-        raise RuntimeError(f"pdftotext failed: {error}")
+        error = _decode_output(result.stderr).strip()
+        raise RuntimeError(f"pdftotext failed: {error or 'Unknown pdftotext error'}")
 
-    from .formatter import format_output
+    return _decode_output(result.stdout)
 
-    blocks = process_document(result.stdout, min_gap)
-    return format_output(blocks)
+
+def _decode_output(data: bytes) -> str:
+    """Decode pdftotext output as UTF-8, translating newlines like text mode."""
+    text = data.decode("utf-8", "replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
@@ -70,6 +70,12 @@ DateTokenPattern = (
 _ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
 _EUROPEAN_DATE_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
 _SLASH_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_MONTH_DAY_YEAR_PATTERN = re.compile(
+    rf"({_MONTH_NAME_PATTERN})\.?\s+(\d{{1,2}}),?\s+(\d{{4}})", re.IGNORECASE
+)
+_DAY_MONTH_YEAR_PATTERN = re.compile(
+    rf"(\d{{1,2}})\s+({_MONTH_NAME_PATTERN})\.?\s+(\d{{4}})", re.IGNORECASE
+)
 
 
 class DateParser:
@@ -114,24 +120,20 @@ class DateParser:
                     except ValueError:
                         pass
 
-        for month_name, month_num in _MONTH_NAMES.items():
-            pattern1 = rf"{re.escape(month_name)}\.?\s+(\d{{1,2}}),?\s+(\d{{4}})"
-            match1 = re.search(pattern1, text, re.IGNORECASE)
-            if match1:
-                try:
-                    day = int(match1.group(1))
-                    year = int(match1.group(2))
-                    month = int(month_num)
-                    return date(year, month, day)
-                except ValueError:
-                    pass
-
-            pattern2 = rf"(\d{{1,2}})\s+{re.escape(month_name)}\.?\s+(\d{{4}})"
-            match2 = re.search(pattern2, text, re.IGNORECASE)
-            if match2:
+        # "Month D, YYYY" and "D Month YYYY" compete: the leftmost one wins
+        month_name_matches = [
+            (match.start(), match.group(2), match.group(1), match.group(3))
+            for match in _MONTH_DAY_YEAR_PATTERN.finditer(text)
+        ] + [
+            (match.start(), match.group(1), match.group(2), match.group(3))
+            for match in _DAY_MONTH_YEAR_PATTERN.finditer(text)
+        ]
+        for _, day_text, month_name, year_text in sorted(month_name_matches):
+            month_num = _MONTH_NAMES.get(month_name.lower())
+            if month_num:
                 try:
-                    day = int(match2.group(1))
-                    year = int(match2.group(2))
+                    day = int(day_text)
+                    year = int(year_text)
                     month = int(month_num)
                     return date(year, month, day)
                 except ValueError:
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import bisect
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property, lru_cache
 
 from .extraction_result import ExtractionResult
 
+_NEWLINE_PATTERN = re.compile(r"\n")
+
+
+@lru_cache(maxsize=256)
+def _compile_ignore_case(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _compile_any_anchor(anchors: tuple[Anchor, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?:{anchor.Pattern})" for anchor in anchors), re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class TextPosition:
@@ -34,6 +48,10 @@ class Anchor:
     BonusVotes: int
     Description: str | None = None
 
+    @cached_property
+    def Regex(self) -> re.Pattern[str]:
+        return re.compile(self.Pattern, re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class FoundAnchor:
@@ -136,37 +154,36 @@ class AnchoredExtractor:
         Anchor(r"beleg\s+von\s+", 3, "Beleg von"),
     ]
 
+    # One search over a line tells whether any of the anchors is worth trying there
     @staticmethod
-    def _build_line_index(text: str) -> list[int]:
-        line_starts = [0]
-        for idx, char in enumerate(text):
-            if char == "\n":
-                line_starts.append(idx + 1)
-        return line_starts
+    def AnyAnchorRegex(anchors: list[Anchor]) -> re.Pattern[str]:
+        return _compile_any_anchor(tuple(anchors))
 
+    # Every extractor runs on the same document text, so keep its index
     @staticmethod
-    def _get_position(char_index: int, length: int, line_starts: list[int]) -> TextPosition:
-        line = 0
-        for i, start in enumerate(line_starts):
-            if start > char_index:
-                break
-            line = i
+    @lru_cache(maxsize=16)
+    def _build_line_index(text: str) -> tuple[int, ...]:
+        return (0, *(match.end() for match in _NEWLINE_PATTERN.finditer(text)))
+
+    @staticmethod
+    def _get_position(char_index: int, length: int, line_starts: tuple[int, ...]) -> TextPosition:
+        line = bisect.bisect_right(line_starts, char_index) - 1
         column = char_index - line_starts[line]
         return TextPosition(line, column, column + length, char_index)
 
     @staticmethod
-    def _find_anchors(text: str, anchors: list[Anchor], line_starts: list[int]) -> list[FoundAnchor]:
+    def _find_anchors(text: str, anchors: list[Anchor], line_starts: tuple[int, ...]) -> list[FoundAnchor]:
         found: list[FoundAnchor] = []
         for anchor in anchors:
-            for match in re.finditer(anchor.Pattern, text, re.IGNORECASE):
+            for match in anchor.Regex.finditer(text):
                 pos = AnchoredExtractor._get_position(match.start(), match.end() - match.start(), line_starts)
                 found.append(FoundAnchor(anchor, pos, match.group(0)))
         return found
 
     @staticmethod
-    def _find_values(text: str, value_pattern: str, line_starts: list[int]) -> list[FoundValue]:
+    def _find_values(text: str, value_pattern: str, line_starts: tuple[int, ...]) -> list[FoundValue]:
         found: list[FoundValue] = []
-        for match in re.finditer(value_pattern, text, re.IGNORECASE):
+        for match in _compile_ignore_case(value_pattern).finditer(text):
             pos = AnchoredExtractor._get_position(match.start(), match.end() - match.start(), line_starts)
             found.append(FoundValue(match.group(0).strip(), pos, match.group(0)))
         return found
@@ -224,6 +241,29 @@ class AnchoredExtractor:
 
         return int(round(anchor.BonusVotes * multiplier))
 
+    @staticmethod
+    def _find_best_anchor(
+        value: FoundValue, found_anchors: list[FoundAnchor]
+    ) -> tuple[int, str | None, AnchorPosition, int]:
+        best_bonus = 0
+        best_anchor_desc: str | None = None
+        best_position = AnchorPosition.None_
+        best_distance = 2**31 - 1
+
+        for anchor in found_anchors:
+            position, distance = AnchoredExtractor._get_relative_position(anchor, value)
+            if position == AnchorPosition.None_:
+                continue
+
+            bonus = AnchoredExtractor._calculate_bonus(anchor.Anchor, position, distance)
+            if bonus > best_bonus or (bonus == best_bonus and distance < best_distance):
+                best_bonus = bonus
+                best_anchor_desc = anchor.Anchor.Description
+                best_position = position
+                best_distance = distance
+
+        return best_bonus, best_anchor_desc, best_position, best_distance
+
     @staticmethod
     def FindAnchored(
         text: str,
@@ -238,23 +278,9 @@ class AnchoredExtractor:
         results: list[AnchoredMatch] = []
 
         for value in found_values:
-            best_bonus = 0
-            best_anchor_desc: str | None = None
-            best_position = AnchorPosition.None_
-            best_distance = 2**31 - 1
-
-            for anchor in found_anchors:
-                position, distance = AnchoredExtractor._get_relative_position(anchor, value)
-                if position == AnchorPosition.None_:
-                    continue
-
-                bonus = AnchoredExtractor._calculate_bonus(anchor.Anchor, position, distance)
-                if bonus > best_bonus or (bonus == best_bonus and distance < best_distance):
-                    best_bonus = bonus
-                    best_anchor_desc = anchor.Anchor.Description
-                    best_position = position
-                    best_distance = distance
-
+            best_bonus, best_anchor_desc, best_position, best_distance = (
+                AnchoredExtractor._find_best_anchor(value, found_anchors)
+            )
             results.append(
                 AnchoredMatch(
                     value.Value,
@@ -270,6 +296,19 @@ class AnchoredExtractor:
 
         return results
 
+    @staticmethod
+    def FindAnchors(text: str, anchors: list[Anchor]) -> list[FoundAnchor]:
+        return AnchoredExtractor._find_anchors(text, anchors, AnchoredExtractor._build_line_index(text))
+
+    # Same bonus FindAnchored gives a value at text[index:index + length], for
+    # callers that score many values against one set of found anchors
+    @staticmethod
+    def GetAnchorBonus(text: str, index: int, length: int, found_anchors: list[FoundAnchor]) -> int:
+        position = AnchoredExtractor._get_position(index, length, AnchoredExtractor._build_line_index(text))
+        matched_text = text[index : index + length]
+        value = FoundValue(matched_text.strip(), position, matched_text)
+        return AnchoredExtractor._find_best_anchor(value, found_anchors)[0]
+
     @staticmethod
     def ExtractBest(
         text: str,
@@ -277,9 +316,21 @@ class AnchoredExtractor:
         anchors: list[Anchor],
         base_votes: int = 1,
     ) -> ExtractionResult:
-        matches = AnchoredExtractor.FindAnchored(text, value_pattern, anchors, base_votes)
-        if not matches:
+        line_starts = AnchoredExtractor._build_line_index(text)
+        found_anchors = AnchoredExtractor._find_anchors(text, anchors, line_starts)
+        found_values = AnchoredExtractor._find_values(text, value_pattern, line_starts)
+
+        # Track the first value with the highest bonus instead of building
+        # an AnchoredMatch per value; base votes are the same for all
+        best: FoundValue | None = None
+        best_bonus = -1
+        for value in found_values:
+            bonus = AnchoredExtractor._find_best_anchor(value, found_anchors)[0]
+            if bonus > best_bonus:
+                best = value
+                best_bonus = bonus
+
+        if best is None:
             return ExtractionResult.NoMatch
 
-        best = max(matches, key=lambda match: match.TotalVotes)
-        return ExtractionResult(best.Value, best.TotalVotes, best.MatchedText)
+        return ExtractionResult(best.Value, base_votes + best_bonus, best.MatchedText)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+
 from ..anchored_extractor import AnchoredExtractor, TextPosition
 from ..extraction_result import ExtractionResult
 from ..i_currency_extractor import ICurrencyExtractor
@@ -14,8 +16,7 @@ class AnchoredCurrencyExtractor(ICurrencyExtractor):
         return "Anchored currency (token)"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         matches = AnchoredExtractor.FindAnchored(
@@ -28,7 +29,8 @@ class AnchoredCurrencyExtractor(ICurrencyExtractor):
         if not matches:
             return []
 
-        amount_tokens = MoneyParser.FindAmountTokens(context.Text)
+        # Tokens come in text order, so their indices are already sorted
+        amount_indices = [token.Index for token in MoneyParser.FindAmountTokens(context.Text)]
         results: list[ExtractionResult] = []
 
         for match in matches:
@@ -39,7 +41,7 @@ class AnchoredCurrencyExtractor(ICurrencyExtractor):
             if not currency:
                 continue
 
-            bonus = self._get_amount_proximity_bonus(amount_tokens, match.ValuePosition)
+            bonus = self._get_amount_proximity_bonus(amount_indices, match.ValuePosition)
             votes = match.TotalVotes + bonus
             if votes <= 0:
                 continue
@@ -72,26 +74,23 @@ class AnchoredCurrencyExtractor(ICurrencyExtractor):
     @classmethod
     def _get_amount_proximity_bonus(
         cls,
-        amount_tokens,
+        amount_indices: list[int],
         value_position: TextPosition,
     ) -> int:
-        if not amount_tokens:
+        if not amount_indices:
             return 0
 
         value_start = value_position.CharIndex
         value_end = value_position.CharIndex + value_position.Length
         min_distance = 2**31 - 1
 
-        for token in amount_tokens:
-            if token.Index < value_start:
-                distance = value_start - token.Index
-            elif token.Index > value_end:
-                distance = token.Index - value_end
-            else:
-                distance = 0
-
-            if distance < min_distance:
-                min_distance = distance
+        # Only the last amount before the value and the first one from its
+        # start on can be the closest
+        pos = bisect.bisect_left(amount_indices, value_start)
+        if pos > 0:
+            min_distance = value_start - amount_indices[pos - 1]
+        if pos < len(amount_indices):
+            min_distance = min(min_distance, max(0, amount_indices[pos] - value_end))
 
         if min_distance <= cls.AmountProximityThreshold:
             return 2
@@ -11,8 +11,7 @@ class DetectedCurrencyExtractor(ICurrencyExtractor):
         return "Detected currency (fallback)"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         currency = MoneyParser.DetectCurrency(context.Text)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from ..locale import Locale
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractionContext:
     Text: str
     Lines: list[str]
@@ -15,6 +15,10 @@ class ExtractionContext:
     EmailSubject: str | None = None
 
     def with_text(self, text: str) -> "ExtractionContext":
+        # The context is immutable, so it can stand in for itself
+        if text is self.Text:
+            return self
+
         return ExtractionContext(
             text,
             self.Lines,
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from operator import attrgetter
 
+_VOTES = attrgetter("Votes")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ExtractionResult:
     Value: str | None
     Votes: int
@@ -13,5 +17,10 @@ class ExtractionResult:
     def HasValue(self) -> bool:
         return self.Value is not None and self.Votes > 0
 
+    @staticmethod
+    def Best(results: Iterable[ExtractionResult]) -> ExtractionResult:
+        # Ties go to the earliest result
+        return max(results, key=_VOTES, default=ExtractionResult.NoMatch)
+
 
 ExtractionResult.NoMatch = ExtractionResult("", 0)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import Iterable
 
 from .extraction_context import ExtractionContext
@@ -13,22 +14,12 @@ class ExtractorAggregator:
         context: ExtractionContext,
         extractors: Iterable["IExtractor"],
     ) -> str | None:
-        votes: dict[str, int] = {}
-
-        for text in texts:
-            text_context = context.with_text(text)
-            for extractor in extractors:
-                for result in extractor.ExtractAll(text_context):
-                    if not result.HasValue:
-                        continue
-
-                    current = votes.get(result.Value, 0)
-                    votes[result.Value] = current + result.Votes
+        votes = ExtractorAggregator._tally_votes(texts, context, extractors)
 
         if not votes:
             return None
 
-        return max(votes.items(), key=lambda item: item[1])[0]
+        return votes.most_common(1)[0][0]
 
     @staticmethod
     def ExtractAll(
@@ -36,19 +27,36 @@ class ExtractorAggregator:
         context: ExtractionContext,
         extractors: Iterable["IExtractor"],
     ) -> list[tuple[str, int]]:
-        votes: dict[str, int] = {}
+        votes = ExtractorAggregator._tally_votes(texts, context, extractors)
 
-        for text in texts:
-            text_context = context.with_text(text)
-            for extractor in extractors:
-                for result in extractor.ExtractAll(text_context):
-                    if not result.HasValue:
-                        continue
+        return votes.most_common()
 
-                    current = votes.get(result.Value, 0)
-                    votes[result.Value] = current + result.Votes
+    @staticmethod
+    def _tally_votes(
+        texts: Iterable[str],
+        context: ExtractionContext,
+        extractors: Iterable["IExtractor"],
+    ) -> Counter[str]:
+        votes: Counter[str] = Counter()
+        # Extractors give the same results for a text every time it is passed
+        results_by_text: dict[str, list[ExtractionResult]] = {}
 
-        return sorted(votes.items(), key=lambda item: item[1], reverse=True)
+        for text in texts:
+            results = results_by_text.get(text)
+            if results is None:
+                text_context = context.with_text(text)
+                results = [
+                    result
+                    for extractor in extractors
+                    for result in extractor.ExtractAll(text_context)
+                    if result.HasValue
+                ]
+                results_by_text[text] = results
+
+            for result in results:
+                votes[result.Value] += result.Votes
+
+        return votes
 
 
 class IExtractor:
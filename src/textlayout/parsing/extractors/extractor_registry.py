@@ -26,7 +26,7 @@ from .vendor_name.company_with_suffix_extractor import CompanyWithSuffixExtracto
 
 
 class ExtractorRegistry:
-    InvoiceNumberExtractors = [
+    InvoiceNumberExtractors = (
         InvoiceNumberColonExtractor(),
         InvoiceHashExtractor(),
         InvoiceNoExtractor(),
@@ -38,40 +38,40 @@ class ExtractorRegistry:
         ReferenceNumberExtractor(),
         CreditNoteNumberExtractor(),
         RefNoExtractor(),
-    ]
+    )
 
-    CurrencyExtractors = [
+    CurrencyExtractors = (
         AnchoredCurrencyExtractor(),
         DetectedCurrencyExtractor(),
-    ]
+    )
 
-    TotalAmountExtractors = [
+    TotalAmountExtractors = (
         AnchoredTotalAmountExtractor(),
-    ]
+    )
 
-    VendorNameExtractors = [
+    VendorNameExtractors = (
         CompanyWithSuffixExtractor(),
-    ]
+    )
 
-    InvoiceDateExtractors = [
+    InvoiceDateExtractors = (
         AnchoredInvoiceDateExtractor(),
         AnyDateExtractor(),
-    ]
+    )
 
-    DueDateExtractors = [
+    DueDateExtractors = (
         AnchoredDueDateExtractor(),
-    ]
+    )
 
-    VatAmountExtractors = [
+    VatAmountExtractors = (
         VatAmountExtractor(),
         SwedishReverseVatExtractor(),
-    ]
+    )
 
-    VatRateExtractors = [
+    VatRateExtractors = (
         VatRateExtractor(),
-    ]
+    )
 
-    SubtotalExtractors = [
+    SubtotalExtractors = (
         SubtotalExtractor(),
         SwedishReverseSubtotalExtractor(),
-    ]
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import re
 
 from ..anchored_extractor import Anchor, AnchoredExtractor
@@ -7,8 +8,9 @@ from ..extraction_result import ExtractionResult
 from ..i_due_date_extractor import IDueDateExtractor
 from ...date_parser import DateTokenPattern
 
-_RANGE_DASH_REGEX = re.compile(r"\s[-–]\s")
-_RANGE_WORD_REGEX = re.compile(r"\bto\b", re.IGNORECASE)
+_DATE_TOKEN_REGEX = re.compile(DateTokenPattern, re.IGNORECASE)
+_DIGIT_REGEX = re.compile(r"\d")
+_RANGE_REGEX = re.compile(r"\s[-–]\s|\bto\b", re.IGNORECASE)
 
 
 class AnchoredDueDateExtractor(IDueDateExtractor):
@@ -17,8 +19,7 @@ class AnchoredDueDateExtractor(IDueDateExtractor):
         return "Anchored due date"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         results: list[ExtractionResult] = []
@@ -40,33 +41,60 @@ class AnchoredDueDateExtractor(IDueDateExtractor):
     @classmethod
     def _extract_anchored_dates_from_lines(cls, context, anchors: list[Anchor]):
         results: list[ExtractionResult] = []
+        # Date matches per line index, shared by anchor lines and their neighbors
+        date_matches_cache: dict[int, list[re.Match[str]]] = {}
+        any_anchor_regex = AnchoredExtractor.AnyAnchorRegex(anchors)
         for line_index, line in enumerate(context.Lines):
             if not line or not line.strip():
                 continue
 
+            # Most lines carry no anchor at all; rule them out with a single search
+            if not any_anchor_regex.search(line):
+                continue
+
             for anchor in anchors:
-                anchor_matches = list(re.finditer(anchor.Pattern, line, re.IGNORECASE))
+                anchor_matches = list(anchor.Regex.finditer(line))
                 if not anchor_matches:
                     continue
 
-                date_matches = list(re.finditer(DateTokenPattern, line, re.IGNORECASE))
+                date_matches = cls._get_date_matches(context.Lines, line_index, date_matches_cache)
                 if date_matches:
                     cls._add_date_matches_with_anchors(results, line, anchor_matches, date_matches, 1 + anchor.BonusVotes)
                     continue
 
-                cls._add_neighbor_date_matches(results, context.Lines, line_index, 1 + anchor.BonusVotes)
+                cls._add_neighbor_date_matches(
+                    results, context.Lines, line_index, 1 + anchor.BonusVotes, date_matches_cache
+                )
 
         return results
 
     @staticmethod
-    def _add_neighbor_date_matches(results, lines, line_index: int, anchor_votes: int) -> None:
+    def _get_date_matches(lines, line_index: int, date_matches_cache: dict[int, list[re.Match[str]]]):
+        date_matches = date_matches_cache.get(line_index)
+        if date_matches is None:
+            # Every date token has a year, so lines without digits cannot hold one
+            line = lines[line_index]
+            date_matches = list(_DATE_TOKEN_REGEX.finditer(line)) if _DIGIT_REGEX.search(line) else []
+            date_matches_cache[line_index] = date_matches
+        return date_matches
+
+    @staticmethod
+    def _add_neighbor_date_matches(
+        results, lines, line_index: int, anchor_votes: int, date_matches_cache: dict[int, list[re.Match[str]]]
+    ) -> None:
         max_offset = 6
         for offset in range(1, max_offset + 1):
-            AnchoredDueDateExtractor._add_date_matches_for_line(results, lines, line_index - offset, anchor_votes, offset)
-            AnchoredDueDateExtractor._add_date_matches_for_line(results, lines, line_index + offset, anchor_votes, offset)
+            AnchoredDueDateExtractor._add_date_matches_for_line(
+                results, lines, line_index - offset, anchor_votes, offset, date_matches_cache
+            )
+            AnchoredDueDateExtractor._add_date_matches_for_line(
+                results, lines, line_index + offset, anchor_votes, offset, date_matches_cache
+            )
 
     @staticmethod
-    def _add_date_matches_for_line(results, lines, line_index: int, anchor_votes: int, offset: int) -> None:
+    def _add_date_matches_for_line(
+        results, lines, line_index: int, anchor_votes: int, offset: int, date_matches_cache: dict[int, list[re.Match[str]]]
+    ) -> None:
         if line_index < 0 or line_index >= len(lines):
             return
 
@@ -74,7 +102,7 @@ class AnchoredDueDateExtractor(IDueDateExtractor):
         if not line or not line.strip():
             return
 
-        date_matches = list(re.finditer(DateTokenPattern, line, re.IGNORECASE))
+        date_matches = AnchoredDueDateExtractor._get_date_matches(lines, line_index, date_matches_cache)
         if not date_matches:
             return
 
@@ -100,7 +128,13 @@ class AnchoredDueDateExtractor(IDueDateExtractor):
             if AnchoredDueDateExtractor._is_range_token(line, match):
                 continue
 
-            distance = min(abs(match.start() - anchor_index) for anchor_index in anchors)
+            # Anchor starts come from finditer in order, so only the neighbours of
+            # the date's insertion point can be the closest
+            date_start = match.start()
+            pos = bisect.bisect_left(anchors, date_start)
+            distance = anchors[pos] - date_start if pos < len(anchors) else date_start - anchors[-1]
+            if 0 < pos < len(anchors):
+                distance = min(distance, date_start - anchors[pos - 1])
             distance_penalty = min(3, distance // 20)
             votes = max(1, anchor_votes - distance_penalty)
             results.append(ExtractionResult(match.group(0), votes, match.group(0)))
@@ -111,4 +145,7 @@ class AnchoredDueDateExtractor(IDueDateExtractor):
         end = min(len(line), date_match.start() + len(date_match.group(0)) + 6)
         window = line[start:end]
 
-        return bool(_RANGE_DASH_REGEX.search(window) or _RANGE_WORD_REGEX.search(window))
+        # Most dates are not ranges; skip the regex when no dash or "to" is present
+        if "-" not in window and "–" not in window and "to" not in window.lower():
+            return False
+        return _RANGE_REGEX.search(window) is not None
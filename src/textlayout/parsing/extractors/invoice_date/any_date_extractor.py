@@ -6,6 +6,8 @@ from ..extraction_result import ExtractionResult
 from ..i_invoice_date_extractor import IInvoiceDateExtractor
 from ...date_parser import DateTokenPattern
 
+_DATE_TOKEN_REGEX = re.compile(DateTokenPattern, re.IGNORECASE)
+
 
 class AnyDateExtractor(IInvoiceDateExtractor):
     @property
@@ -13,11 +15,10 @@ class AnyDateExtractor(IInvoiceDateExtractor):
         return "Any date (fallback)"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
-        matches = list(re.finditer(DateTokenPattern, context.Text, re.IGNORECASE))
+        matches = list(_DATE_TOKEN_REGEX.finditer(context.Text))
         if not matches:
             return []
 
@@ -13,8 +13,7 @@ class AlphaNumericHyphenExtractor(IInvoiceNumberExtractor):
         return "Alpha-numeric hyphen (XXXX00-000)"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         matches = AnchoredExtractor.FindAnchored(
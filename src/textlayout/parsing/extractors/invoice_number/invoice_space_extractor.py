@@ -18,8 +18,7 @@ class InvoiceSpaceExtractor(IInvoiceNumberExtractor):
         return "Invoice/INV + space"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         matches = list(_PATTERN.finditer(context.Text))
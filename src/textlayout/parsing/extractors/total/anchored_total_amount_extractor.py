@@ -8,16 +8,21 @@ from ..extraction_result import ExtractionResult
 from ..i_total_amount_extractor import ITotalAmountExtractor
 from ...money_parser import MoneyParser
 
+_AMOUNT_TOKEN_REGEX = re.compile(MoneyParser.AmountTokenPattern, re.IGNORECASE)
+_CURRENCY_TOKEN_REGEX = re.compile(MoneyParser.CurrencyTokenPattern, re.IGNORECASE)
 _TOTAL_DUE_LINE_PATTERN = re.compile(
     r"(?:total\s*due|due\s*[:：]?\s*total|amount\s+due|balance\s+due|att\s+betala)",
     re.IGNORECASE,
 )
-_VAT_LINE_PATTERN = re.compile(r"\b(?:vat|moms|mva|tax|mwst|iva|gst)\b", re.IGNORECASE)
-_EXCLUDING_LINE_PATTERN = re.compile(
-    r"\b(?:excl|exklusive|excluding|subtotal|sub[-\s]?total|netto|net)\b",
+_VAT_WORDS = r"\b(?:vat|moms|mva|tax|mwst|iva|gst)\b"
+_EXCLUDING_WORDS = r"\b(?:excl|exklusive|excluding|subtotal|sub[-\s]?total|netto|net)\b"
+_ROUNDING_WORDS = r"\b(?:rounding|avrund|rundning)\b"
+_VAT_LINE_PATTERN = re.compile(_VAT_WORDS, re.IGNORECASE)
+# VAT, excluding and rounding words in one scan; the group tells which kind matched
+_LINE_CLASS_PATTERN = re.compile(
+    rf"(?P<vat>{_VAT_WORDS})|(?P<excluding>{_EXCLUDING_WORDS})|(?P<rounding>{_ROUNDING_WORDS})",
     re.IGNORECASE,
 )
-_ROUNDING_LINE_PATTERN = re.compile(r"\b(?:rounding|avrund|rundning)\b", re.IGNORECASE)
 _DATE_LINE_PATTERN = re.compile(
     r"\b\d{4}[-/\.]\d{2}[-/\.]\d{2}\b|\b\d{2}[-/\.]\d{2}[-/\.]\d{4}\b",
     re.IGNORECASE,
@@ -33,12 +38,12 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
         return "Anchored total amount (token)"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         results: list[ExtractionResult] = []
-        total_due_result = self._try_extract_total_due_from_block(context)
+        lines = context.Text.split("\n")
+        total_due_result = self._try_extract_total_due_from_block(context, lines)
         if total_due_result is not None and total_due_result.HasValue:
             results.append(total_due_result)
 
@@ -53,7 +58,6 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
             return results
 
         currency_tokens = MoneyParser.FindCurrencyTokens(context.Text)
-        lines = context.Text.split("\n")
         anchor_lines = self._find_anchor_lines(lines, AnchoredExtractor.TotalAmountAnchors)
 
         for match in matches:
@@ -87,15 +91,16 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
         return results
 
     @classmethod
-    def _try_extract_total_due_from_block(cls, context) -> ExtractionResult | None:
-        lines = context.Text.split("\n")
+    def _try_extract_total_due_from_block(cls, context, lines: list[str]) -> ExtractionResult | None:
         candidates: list[tuple[Decimal, str, int, str]] = []
+        # Amounts per line index, shared by the windows of nearby total-due lines
+        line_amounts_cache: dict[int, list[tuple[Decimal, str]]] = {}
 
         for i, line in enumerate(lines):
             if not _TOTAL_DUE_LINE_PATTERN.search(line):
                 continue
 
-            if re.search(MoneyParser.AmountTokenPattern, line, re.IGNORECASE):
+            if _AMOUNT_TOKEN_REGEX.search(line):
                 inline_candidate = cls._extract_best_amount_from_line(line, context.Locale)
                 if inline_candidate is not None:
                     amount, raw = inline_candidate
@@ -103,8 +108,8 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
                     return ExtractionResult(raw, votes, line.strip())
 
             for offset in range(1, cls.TotalDueSearchWindow + 1):
-                cls._add_line_candidates(lines, i - offset, offset, context.Locale, candidates)
-                cls._add_line_candidates(lines, i + offset, offset, context.Locale, candidates)
+                cls._add_line_candidates(lines, i - offset, offset, context.Locale, candidates, line_amounts_cache)
+                cls._add_line_candidates(lines, i + offset, offset, context.Locale, candidates, line_amounts_cache)
 
         if not candidates:
             return None
@@ -125,19 +130,31 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
         line_distance: int,
         locale,
         candidates: list[tuple[Decimal, str, int, str]],
+        line_amounts_cache: dict[int, list[tuple[Decimal, str]]],
     ) -> None:
         if line_index < 0 or line_index >= len(lines):
             return
 
         line = lines[line_index]
+        line_amounts = line_amounts_cache.get(line_index)
+        if line_amounts is None:
+            line_amounts = cls._get_line_amounts(line, locale)
+            line_amounts_cache[line_index] = line_amounts
+
+        for amount, amount_text in line_amounts:
+            candidates.append((amount, amount_text, line_distance, line))
+
+    @classmethod
+    def _get_line_amounts(cls, line: str, locale) -> list[tuple[Decimal, str]]:
+        line_amounts: list[tuple[Decimal, str]] = []
         if cls._is_vat_percent_line(line):
-            return
+            return line_amounts
 
-        currency_matches = list(re.finditer(MoneyParser.CurrencyTokenPattern, line, re.IGNORECASE))
+        currency_matches = list(_CURRENCY_TOKEN_REGEX.finditer(line))
         if not currency_matches and _DATE_LINE_PATTERN.search(line):
-            return
+            return line_amounts
 
-        for match in re.finditer(MoneyParser.AmountTokenPattern, line, re.IGNORECASE):
+        for match in _AMOUNT_TOKEN_REGEX.finditer(line):
             if cls._is_percent_token(line, match.start(), len(match.group(0))):
                 continue
 
@@ -151,20 +168,22 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
             if not currency_matches and cls._is_likely_year(amount):
                 continue
 
-            candidates.append((amount, match.group(0).strip(), line_distance, line))
+            line_amounts.append((amount, match.group(0).strip()))
+
+        return line_amounts
 
     @classmethod
     def _extract_best_amount_from_line(cls, line: str, locale) -> tuple[Decimal, str] | None:
         if cls._is_vat_percent_line(line):
             return None
 
-        currency_matches = list(re.finditer(MoneyParser.CurrencyTokenPattern, line, re.IGNORECASE))
+        currency_matches = list(_CURRENCY_TOKEN_REGEX.finditer(line))
         if not currency_matches and _DATE_LINE_PATTERN.search(line):
             return None
 
         candidates: list[tuple[Decimal, str, int]] = []
 
-        for match in re.finditer(MoneyParser.AmountTokenPattern, line, re.IGNORECASE):
+        for match in _AMOUNT_TOKEN_REGEX.finditer(line):
             if cls._is_percent_token(line, match.start(), len(match.group(0))):
                 continue
 
@@ -233,13 +252,8 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
 
     @staticmethod
     def _find_anchor_lines(lines: list[str], anchors: list[Anchor]) -> list[int]:
-        anchor_lines: list[int] = []
-        for i, line in enumerate(lines):
-            for anchor in anchors:
-                if re.search(anchor.Pattern, line, re.IGNORECASE):
-                    anchor_lines.append(i)
-                    break
-        return anchor_lines
+        any_anchor_regex = AnchoredExtractor.AnyAnchorRegex(anchors)
+        return [i for i, line in enumerate(lines) if any_anchor_regex.search(line)]
 
     @staticmethod
     def _get_line_text(lines: list[str], line_index: int) -> str:
@@ -266,28 +280,19 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
         if not line_text or not line_text.strip():
             return 0
 
-        if cls._is_vat_percent_line(line_text):
-            return 4
-
-        if _VAT_LINE_PATTERN.search(line_text):
-            return 3
-
-        if _EXCLUDING_LINE_PATTERN.search(line_text):
-            return 2
+        match = _LINE_CLASS_PATTERN.search(line_text)
+        if match is None:
+            return 0
 
-        if _ROUNDING_LINE_PATTERN.search(line_text):
-            return 2
+        # A VAT word outranks an earlier excluding or rounding word
+        if match.lastgroup == "vat" or _VAT_LINE_PATTERN.search(line_text, match.end()):
+            return 4 if "%" in line_text else 3
 
-        return 0
+        return 2
 
     @classmethod
     def _is_excluded_line(cls, line_text: str) -> bool:
-        return (
-            cls._is_vat_percent_line(line_text)
-            or _VAT_LINE_PATTERN.search(line_text)
-            or _EXCLUDING_LINE_PATTERN.search(line_text)
-            or _ROUNDING_LINE_PATTERN.search(line_text)
-        )
+        return _LINE_CLASS_PATTERN.search(line_text) is not None
 
     @classmethod
     def _is_vat_percent_line(cls, line_text: str) -> bool:
@@ -302,14 +307,8 @@ class AnchoredTotalAmountExtractor(ITotalAmountExtractor):
         prefix = line_text[:safe_column]
         last_index = -1
 
-        for match in _EXCLUDING_LINE_PATTERN.finditer(prefix):
-            last_index = max(last_index, match.start())
-
-        for match in _VAT_LINE_PATTERN.finditer(prefix):
-            last_index = max(last_index, match.start())
-
-        for match in _ROUNDING_LINE_PATTERN.finditer(prefix):
-            last_index = max(last_index, match.start())
+        for match in _LINE_CLASS_PATTERN.finditer(prefix):
+            last_index = match.start()
 
         if last_index < 0:
             return False
@@ -6,6 +6,7 @@ from ..extraction_result import ExtractionResult
 from ..i_subtotal_extractor import ISubtotalExtractor
 from ...money_parser import MoneyParser
 
+_PATTERN = re.compile(r"(?<!\d)([€$£]?\d{1,6}[.,]\d{2,3}[€$£]?)\s*Delsumma\s+i\s+(?:EUR|SEK|USD|GBP)", re.IGNORECASE)
 _YEAR_LIKE_PATTERN = re.compile(r"^20\d{4}[.,]\d{2,3}")
 
 
@@ -15,18 +16,17 @@ class SwedishReverseSubtotalExtractor(ISubtotalExtractor):
         return "Swedish reverse subtotal (amount before label)"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
-        pattern = r"(?<!\d)([€$£]?\d{1,6}[.,]\d{2,3}[€$£]?)\s*Delsumma\s+i\s+(?:EUR|SEK|USD|GBP)"
-        matches = list(re.finditer(pattern, context.Text, re.IGNORECASE))
+        matches = list(_PATTERN.finditer(context.Text))
         if not matches:
             return []
 
         results: list[ExtractionResult] = []
         for match in matches:
-            if _YEAR_LIKE_PATTERN.search(match.group(1)):
+            # Only amounts starting with "20" can look like a year
+            if match.group(1).startswith("20") and _YEAR_LIKE_PATTERN.search(match.group(1)):
                 continue
 
             amount_text = match.group(1).strip()
@@ -6,6 +6,15 @@ from ..extraction_result import ExtractionResult
 from ..i_vat_amount_extractor import IVatAmountExtractor
 from ...money_parser import MoneyParser
 
+_PATTERNS = [
+    (re.compile(pattern + r"([€$£]?\s*[\d\s\.,]+)", re.IGNORECASE), votes)
+    for pattern, votes in (
+        (r"vat\s+amount\s*[:：]?\s*", 3),
+        (r"(?:moms|mva)\s*[:：]?\s*", 3),
+        (r"vat\s*[-–]\s*\w+\s*\d+%\s*(?:on\s*[€$£]?[\d\s\.,]+)?\s*", 2),
+    )
+]
+
 
 class VatAmountExtractor(IVatAmountExtractor):
     @property
@@ -13,21 +22,13 @@ class VatAmountExtractor(IVatAmountExtractor):
         return "VAT amount"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
-        patterns = [
-            (r"vat\s+amount\s*[:：]?\s*", 3),
-            (r"(?:moms|mva)\s*[:：]?\s*", 3),
-            (r"vat\s*[-–]\s*\w+\s*\d+%\s*(?:on\s*[€$£]?[\d\s\.,]+)?\s*", 2),
-        ]
-
         results: list[ExtractionResult] = []
 
-        for pattern, votes in patterns:
-            full_pattern = pattern + r"([€$£]?\s*[\d\s\.,]+)"
-            for match in re.finditer(full_pattern, context.Text, re.IGNORECASE):
+        for regex, votes in _PATTERNS:
+            for match in regex.finditer(context.Text):
                 amount_str = match.group(1)
                 amount = MoneyParser.ParseAmount(amount_str, context.Locale)
                 if amount is not None and amount > 0 and amount < 10_000_000:
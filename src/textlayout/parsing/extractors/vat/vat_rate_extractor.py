@@ -6,6 +6,12 @@ from decimal import Decimal, InvalidOperation
 from ..extraction_result import ExtractionResult
 from ..i_vat_rate_extractor import IVatRateExtractor
 
+_PATTERNS = [
+    re.compile(r"(?:vat|moms|tax)\s*[-–]?\s*[^0-9]*(\d+(?:[.,]\d+)?)\s*%", re.IGNORECASE),
+    re.compile(r"(\d+(?:[.,]\d+)?)\s*%\s*(?:vat|moms|tax)", re.IGNORECASE),
+    re.compile(r"vat\s+rate\s*[:：]?\s*(\d+(?:[.,]\d+)?)\s*%", re.IGNORECASE),
+]
+
 
 class VatRateExtractor(IVatRateExtractor):
     @property
@@ -13,20 +19,13 @@ class VatRateExtractor(IVatRateExtractor):
         return "VAT rate"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
-        patterns = [
-            r"(?:vat|moms|tax)\s*[-–]?\s*[^0-9]*(\d+(?:[.,]\d+)?)\s*%",
-            r"(\d+(?:[.,]\d+)?)\s*%\s*(?:vat|moms|tax)",
-            r"vat\s+rate\s*[:：]?\s*(\d+(?:[.,]\d+)?)\s*%",
-        ]
-
         results: list[ExtractionResult] = []
 
-        for pattern in patterns:
-            for match in re.finditer(pattern, context.Text, re.IGNORECASE):
+        for regex in _PATTERNS:
+            for match in regex.finditer(context.Text):
                 rate_str = match.group(1).replace(",", ".")
                 try:
                     rate = Decimal(rate_str)
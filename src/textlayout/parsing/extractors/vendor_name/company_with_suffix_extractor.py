@@ -6,9 +6,11 @@ from ..anchored_extractor import AnchoredExtractor
 from ..extraction_result import ExtractionResult
 from ..i_vendor_name_extractor import IVendorNameExtractor
 
+# Words are split on spaces and tabs only: words already take "&" and "-", so
+# splitting on those too gave the engine many equivalent ways to try per run
 _VALUE_PATTERN = (
     r"\b(?!(?:Your|The|From|von|från|Bill|Invoice|Receipt|Payment|Sent|Kvitto|Faktura|Rechnung|Thank|Thanks)\b)"
-    r"([A-Z][A-Za-z0-9&\-\.,]*(?:[ \t&\-](?!from\b|von\b|från\b)[A-Z][A-Za-z0-9&\-\.,]*){0,3})"
+    r"([A-Z][A-Za-z0-9&\-\.,]*(?:[ \t][A-Z][A-Za-z0-9&\-\.,]*){0,3})"
     r"[ \t]+(s\.?r\.?o|Ltd|LLC|Inc|AB|AS|Oy|GmbH|Corp|Limited|PLC|PBC)\b\.?"
 )
 _COMPANY_WITH_SUFFIX_PATTERN = re.compile(_VALUE_PATTERN)
@@ -22,8 +24,7 @@ class CompanyWithSuffixExtractor(IVendorNameExtractor):
         return "Company with legal suffix"
 
     def Extract(self, context):
-        results = self.ExtractAll(context)
-        return ExtractionResult.NoMatch if not results else max(results, key=lambda result: result.Votes)
+        return ExtractionResult.Best(self.ExtractAll(context))
 
     def ExtractAll(self, context):
         matches = list(_COMPANY_WITH_SUFFIX_PATTERN.finditer(context.Text))
@@ -31,6 +32,8 @@ class CompanyWithSuffixExtractor(IVendorNameExtractor):
             return []
 
         results: list[ExtractionResult] = []
+        found_anchors = AnchoredExtractor.FindAnchors(context.Text, AnchoredExtractor.VendorNameAnchors)
+        votes_by_text: dict[str, int] = {}
 
         for match in matches:
             company_name = match.group(1).strip()
@@ -43,14 +46,16 @@ class CompanyWithSuffixExtractor(IVendorNameExtractor):
                 continue
 
             match_text = match.group(0)
-            temp_result = AnchoredExtractor.FindAnchored(
-                context.Text,
-                re.escape(match_text),
-                AnchoredExtractor.VendorNameAnchors,
-                base_votes=2,
-            )
-
-            votes = temp_result[0].TotalVotes if temp_result else 2
+            votes = votes_by_text.get(match_text)
+            if votes is None:
+                # Votes come from the first case-insensitive occurrence of the text,
+                # which is at the latest this match itself
+                first = re.compile(re.escape(match_text), re.IGNORECASE).search(context.Text, 0, match.end())
+                votes = 2 + AnchoredExtractor.GetAnchorBonus(
+                    context.Text, first.start(), first.end() - first.start(), found_anchors
+                )
+                votes_by_text[match_text] = votes
+
             results.append(ExtractionResult(vendor, votes, match_text))
 
         return results
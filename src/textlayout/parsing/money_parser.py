@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
 from .locale import Locale
 
@@ -102,7 +103,10 @@ class MoneyParser:
 
         return AmountResult(total, exc_vat, vat, vat_rate, currency)
 
+    # The same amount tokens are parsed by several extractors and for every text
+    # the aggregator runs them over; Decimal results are immutable, so share them
     @staticmethod
+    @lru_cache(maxsize=1024)
     def ParseAmount(text: str, locale: Locale) -> Decimal | None:
         text = _ANY_CURRENCY_PATTERN.sub("", text).strip()
         if not text:
@@ -1,6 +1,30 @@
 """Tests for the parser module."""
 
-from textlayout import process_document, format_output
+import importlib.util
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from textlayout import (
+    detect_blocks,
+    extract_block,
+    format_output,
+    process_document,
+    text_to_matrix,
+)
+from textlayout.parser import (
+    _run_pdftotext,
+    _run_pdftotext_in_ranges,
+    find_text_bounds,
+    find_vertical_gaps,
+    is_blank_row,
+    split_horizontal,
+    split_vertical,
+)
+from textlayout.parsing.date_parser import DateParser
+from textlayout.parsing.locale import Locale
 
 
 def test_simple_columns():
@@ -72,3 +96,140 @@ CCC: 3"""
     # Check colons are aligned
     colon_positions = [line.index(":") for line in lines if ":" in line]
     assert len(set(colon_positions)) == 1  # All colons at same position
+
+
+def test_character_matrix_input():
+    matrix = [list("Name   Age"), list("John   25 ")]
+
+    assert detect_blocks(matrix) == ["Name: John", "Age: 25"]
+    assert extract_block(matrix, 0, 1, 7, 9) == "Age: 25"
+
+
+def test_text_to_matrix_is_editable():
+    matrix = text_to_matrix("Name   Age\nJohn   25")
+    assert matrix[1] == list("John   25 ")
+
+    matrix[1][7] = "3"
+    assert detect_blocks(matrix) == ["Name: John", "Age: 35"]
+
+
+def test_helpers_accept_character_matrix():
+    matrix = text_to_matrix("Name   Age\nJohn   25\n\nTotal  99")
+
+    assert is_blank_row(matrix, 2)
+    assert not is_blank_row(matrix, 0)
+    assert split_horizontal(matrix) == [(0, 1), (3, 3)]
+    assert find_vertical_gaps(matrix, 0, 1, 2) == [(4, 6)]
+    assert find_text_bounds(matrix, 0, 1, 0, 4) == (0, 3)
+    assert split_vertical(matrix, 0, 1, 2) == [(0, 3), (7, 9)]
+
+
+def _write_pdf(path, pages):
+    """Write a minimal PDF with one Helvetica text line per (x, y, text) item."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+    font_id = 3
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_ids = []
+    for items in pages:
+        content = "".join(
+            f"BT /F1 10 Tf {x} {y} Td ({text}) Tj ET\n" for x, y, text in items
+        ).encode()
+        stream = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        objects.append(stream)
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (content_id, font_id)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(data))
+
+
+@pytest.mark.skipif(
+    shutil.which("pdftotext") is None, reason="Poppler is not installed"
+)
+def test_page_ranges_match_single_run(tmp_path):
+    pages = [
+        [(72, 720, f"Page {page}"), (72, 700, "Name"), (300, 700, "Amount")]
+        + [(72 + 20 * page, 680 - 14 * i, f"Item {page}.{i}") for i in range(page + 1)]
+        + [(400 - 30 * page, 500, f"Total {page * 100}.00")]
+        for page in range(1, 6)
+    ]
+    pdf_path = tmp_path / "ranges.pdf"
+    _write_pdf(pdf_path, pages)
+
+    single_run = _run_pdftotext(str(pdf_path))
+    assert "Total 500.00" in single_run
+    for workers in (2, 3, 5):
+        ranges_run = _run_pdftotext_in_ranges(str(pdf_path), len(pages), workers)
+        assert ranges_run == single_run
+
+
+def test_month_day_year_dates():
+    text = "Invoice date: March 5, 2024"
+    assert DateParser.Parse(text, Locale.US) == date(2024, 3, 5)
+    assert DateParser.Parse("Paid Sept 30 2024", Locale.US) == date(2024, 9, 30)
+
+
+def test_day_month_year_dates():
+    assert DateParser.Parse("Datum: 5 mars 2024", Locale.European) == date(2024, 3, 5)
+    assert DateParser.Parse("Due 9 Jan. 2024", Locale.Unknown) == date(2024, 1, 9)
+
+
+def test_leftmost_month_name_date_wins():
+    period = "Dec 9, 2023 – Jan 9, 2024"
+    assert DateParser.Parse(period, Locale.US) == date(2023, 12, 9)
+
+    period = "9 December 2023 - 9 January 2024"
+    assert DateParser.Parse(period, Locale.European) == date(2023, 12, 9)
+
+    # An impossible date is skipped in favour of the next one
+    text = "Sept 31, 2024 and Oct 1, 2024"
+    assert DateParser.Parse(text, Locale.US) == date(2024, 10, 1)
+
+
+def test_leftmost_date_wins_across_shapes():
+    text = "5 March 2024 and Jan 9, 2024"
+    assert DateParser.Parse(text, Locale.US) == date(2024, 3, 5)
+    assert DateParser.Parse("Jan 9, 2024 and 5 March 2024", Locale.US) == date(
+        2024, 1, 9
+    )
+
+
+def _load_extract_fixtures():
+    path = Path(__file__).parent.parent / "scripts" / "extract_fixtures.py"
+    spec = importlib.util.spec_from_file_location("extract_fixtures", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_read_poppler_section_crlf(tmp_path):
+    extract_fixtures = _load_extract_fixtures()
+    content = (
+        "Header\r\nPoppler pdftotext**********\r\n"
+        "--- Page 1 ---\r\nName   Age\r\nJohn   25\rTotal\r\n"
+        "Python MarkItDown**********\r\nrest\r\n"
+    )
+    payload = tmp_path / "payload.txt"
+    payload.write_bytes(content.encode("utf-8"))
+
+    section = extract_fixtures.read_poppler_section(str(payload))
+    assert section == "Name   Age\nJohn   25\nTotal"
+    with open(payload, encoding="utf-8") as f:
+        assert section == extract_fixtures.extract_poppler_section(f.read())